@@ -43,12 +43,28 @@ class DiagnosticsConfig(BaseModel):
     enable_ml: bool = False  # ML-based anomaly detection
 
 
-class RemediationConfig(BaseModel):
+class SimulatedToolConfig(BaseModel):
+    """Settings shared by the tools built on ``tools.base.SimulatedTool``."""
+    audit_log_path: Optional[str] = None  # JSON-lines audit log, disabled if unset
+    audit_queue_size: int = 10000  # records buffered before new ones are dropped
+    audit_batch_size: int = 512  # max records per audit log write
+    audit_flush_interval: float = 1.0  # seconds to coalesce records before a write
+    simulate_delay: bool = True  # sleep in simulated handlers; disable for tests/benchmarks
+
+
+class RemediationConfig(SimulatedToolConfig):
     """Configuration for remediation tools."""
     dry_run_only: bool = False
     require_approval: bool = True
     max_retries: int = 3
+    retry_base_delay: float = 1.0  # seconds, backoff before the first retry
+    retry_max_delay: float = 30.0  # seconds, upper bound for any retry backoff
     rollback_on_failure: bool = True
+    history_max: int = Field(default=10000, ge=1)  # max remediation records kept in memory
+    max_concurrent_remediations: int = Field(default=8, ge=1)  # handlers allowed to run at once
+    max_inflight_remediations: int = Field(default=256, ge=1)  # queued + running before new requests are rejected
+    idempotency_ttl: float = 60.0  # seconds a completed result is replayed for identical requests
+    idempotency_cache_size: int = Field(default=1024, ge=1)  # max cached results, least recently used evicted first
     allowed_actions: List[str] = Field(
         default_factory=lambda: [
             "restart_service",
@@ -60,11 +76,13 @@ class RemediationConfig(BaseModel):
     )
 
 
-class RollbackConfig(BaseModel):
+class RollbackConfig(SimulatedToolConfig):
     """Configuration for rollback tools."""
     enabled: bool = True
     history_retention_days: int = 7
     auto_rollback_on_failure: bool = True
+    history_max: int = 10000  # max rollback records kept in memory
+    snapshot_max: int = 1000  # max state snapshots kept, least recently used evicted first
 
 
 class ServerConfig(BaseSettings):
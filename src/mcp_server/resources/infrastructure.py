@@ -30,7 +30,7 @@ class InfrastructureResourceProvider:
         self.cache: Dict[str, Any] = {}
         self.cache_timestamp: Dict[str, datetime] = {}
         
-        logger.info(f"Initialized InfrastructureResourceProvider with platforms: {config.platforms}")
+        logger.info("Initialized InfrastructureResourceProvider with platforms: %s", config.platforms)
     
     async def list_resources(self) -> List[Resource]:
         """
@@ -127,11 +127,11 @@ class InfrastructureResourceProvider:
         """
         # Check cache
         if self._is_cached(uri):
-            logger.debug(f"Returning cached infrastructure data for {uri}")
+            logger.debug("Returning cached infrastructure data for %s", uri)
             return self.cache[uri]
         
         # Parse URI
-        parts = uri.replace("infra://", "").split("/")
+        parts = uri.removeprefix("infra://").split("/")
         platform = parts[0] if parts else "unknown"
         service = parts[1] if len(parts) > 1 else "all"
         resource_type = parts[2] if len(parts) > 2 else "all"
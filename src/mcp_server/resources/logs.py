@@ -28,7 +28,7 @@ class LogsResourceProvider:
         self.config = config
         self.cache: Dict[str, Any] = {}
         
-        logger.info(f"Initialized LogsResourceProvider with sources: {config.sources}")
+        logger.info("Initialized LogsResourceProvider with sources: %s", config.sources)
     
     async def list_resources(self) -> List[Resource]:
         """
@@ -101,7 +101,7 @@ class LogsResourceProvider:
             JSON string containing log data.
         """
         # Parse URI
-        parts = uri.replace("logs://", "").split("/")
+        parts = uri.removeprefix("logs://").split("/")
         log_source = parts[0] if parts else "unknown"
         log_type = parts[1] if len(parts) > 1 else "all"
         
@@ -29,7 +29,7 @@ class MetricsResourceProvider:
         self.cache: Dict[str, Any] = {}
         self.cache_timestamp: Dict[str, datetime] = {}
         
-        logger.info(f"Initialized MetricsResourceProvider with providers: {config.providers}")
+        logger.info("Initialized MetricsResourceProvider with providers: %s", config.providers)
     
     async def list_resources(self) -> List[Resource]:
         """
@@ -102,11 +102,11 @@ class MetricsResourceProvider:
         """
         # Check cache
         if self._is_cached(uri):
-            logger.debug(f"Returning cached metrics for {uri}")
+            logger.debug("Returning cached metrics for %s", uri)
             return self.cache[uri]
         
         # Parse URI
-        parts = uri.replace("metrics://", "").split("/")
+        parts = uri.removeprefix("metrics://").split("/")
         metric_type = parts[0] if parts else "unknown"
         metric_name = parts[1] if len(parts) > 1 else "all"
         
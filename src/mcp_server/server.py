@@ -7,7 +7,7 @@ and tools for monitoring, diagnostics, and remediation.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Coroutine, Dict, List, Optional
 from datetime import datetime
 import json
 
@@ -29,6 +29,7 @@ from .tools.diagnostics import DiagnosticsTool
 from .tools.remediation import RemediationTool
 from .tools.rollback import RollbackTool
 from .config import ServerConfig, load_config
+from ..utils.serialization import json_default
 
 # Setup logging
 logging.basicConfig(
@@ -66,7 +67,7 @@ class InfrastructureMonitorServer:
         self._register_resource_handlers()
         self._register_tool_handlers()
         
-        logger.info(f"Initialized {config.name} v{config.version}")
+        logger.info("Initialized %s v%s", config.name, config.version)
     
     def _register_resource_handlers(self) -> None:
         """Register all resource handlers with the MCP server."""
@@ -88,13 +89,13 @@ class InfrastructureMonitorServer:
             if self.config.infra_config.enabled:
                 resources.extend(await self.infra_provider.list_resources())
             
-            logger.info(f"Listed {len(resources)} resources")
+            logger.info("Listed %d resources", len(resources))
             return resources
         
         @self.server.read_resource()
         async def read_resource(uri: str) -> str:
             """Read a specific resource by URI."""
-            logger.info(f"Reading resource: {uri}")
+            logger.info("Reading resource: %s", uri)
             
             # Route to appropriate provider based on URI scheme
             if uri.startswith("metrics://"):
@@ -124,13 +125,13 @@ class InfrastructureMonitorServer:
             # Rollback tools
             tools.extend(await self.rollback_tool.list_tools())
             
-            logger.info(f"Listed {len(tools)} tools")
+            logger.info("Listed %d tools", len(tools))
             return tools
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Execute a tool with given arguments."""
-            logger.info(f"Calling tool: {name} with args: {arguments}")
+            logger.info("Calling tool: %s with args: %s", name, arguments)
             
             try:
                 # Route to appropriate tool
@@ -145,11 +146,11 @@ class InfrastructureMonitorServer:
                 
                 return [TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2)
+                    text=json.dumps(result, indent=2, default=json_default)
                 )]
             
             except Exception as e:
-                logger.error(f"Tool execution failed: {str(e)}")
+                logger.error("Tool execution failed: %s", e)
                 return [TextContent(
                     type="text",
                     text=json.dumps({
@@ -163,12 +164,34 @@ class InfrastructureMonitorServer:
         """Run the MCP server."""
         logger.info("Starting MCP server...")
         
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            # Don't lose audit records still queued for the batched writers
+            await self.remediation_tool.close_audit()
+            await self.rollback_tool.close_audit()
+
+
+def _run(main_coro: Coroutine[Any, Any, None]) -> None:
+    """
+    Run the server's entry coroutine, on a uvloop event loop when installed.
+    
+    ``uvloop.run`` replaces the deprecated ``uvloop.install()`` policy hook.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        asyncio.run(main_coro)
+        return
+    
+    logger.info("Using uvloop event loop")
+    uvloop.run(main_coro)
 
 
 async def main() -> None:
@@ -182,4 +205,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    _run(main())
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Shared plumbing for the MCP server tools backed by simulated actions.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from ...utils.audit import BatchedAuditLog
+from ...utils.ids import IdGenerator
+
+
+class SimulatedTool:
+    """
+    Base class holding the ID generator, audit log and simulated delay.
+
+    Reads ``simulate_delay`` and the ``audit_*`` settings from the tool
+    config (see ``config.SimulatedToolConfig``); the audit log is only
+    created if ``audit_log_path`` is set.
+
+    Conventions shared by the subclasses:
+
+    - Concurrency: updates to in-memory state (history, indexes, snapshots)
+      never await, and no reader iterates that state across an await, so
+      concurrent calls on the event loop cannot observe a half-applied
+      change and no lock is needed. Keep it that way; only handler calls
+      and the simulated work may await.
+    - Static response fields live in module-level ``MappingProxyType``
+      templates; handlers copy them and merge in the per-call values.
+    """
+
+    __slots__ = ("simulate_delay", "_audit_log", "_ids")
+
+    def __init__(self, config: Any):
+        self.simulate_delay = getattr(config, 'simulate_delay', True)
+
+        # Audit records are queued and written in batches by a background
+        # task, keeping persistence off the response path
+        audit_log_path = getattr(config, 'audit_log_path', None)
+        self._audit_log: Optional[BatchedAuditLog] = None
+        if audit_log_path:
+            self._audit_log = BatchedAuditLog(
+                audit_log_path,
+                queue_size=getattr(config, 'audit_queue_size', 10000),
+                batch_size=getattr(config, 'audit_batch_size', 512),
+                flush_interval=getattr(config, 'audit_flush_interval', 1.0)
+            )
+
+        self._ids = IdGenerator()
+
+    async def _simulate_work(self, seconds: float) -> None:
+        """Sleep to mimic a real backend call, unless simulate_delay is off."""
+        if self.simulate_delay:
+            await asyncio.sleep(seconds)
+
+    @property
+    def audit_dropped(self) -> int:
+        """Number of audit records dropped because the audit queue was full."""
+        return self._audit_log.dropped if self._audit_log is not None else 0
+
+    async def flush_audit(self) -> None:
+        """Wait until all queued audit records have been written."""
+        if self._audit_log is not None:
+            await self._audit_log.flush()
+
+    async def close_audit(self) -> None:
+        """Write all queued audit records and stop the audit writer; call at shutdown."""
+        if self._audit_log is not None:
+            await self._audit_log.close()
@@ -5,13 +5,25 @@ Provides tools for diagnosing infrastructure issues, analyzing metrics,
 and performing root cause analysis.
 """
 
+import copy
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from mcp.types import Tool
+import fastjsonschema
+
+from ...utils.concurrency import gather_settled
 
 logger = logging.getLogger(__name__)
 
+# (offset before now, event, impact) entries for the root cause timeline
+_ROOT_CAUSE_TIMELINE = (
+    (timedelta(hours=2), "Traffic spike begins", "Increased database connections"),
+    (timedelta(hours=1, minutes=30), "Connection pool reaches capacity", "New requests start timing out"),
+    (timedelta(hours=1), "Error rate exceeds threshold", "Service degradation visible to users"),
+    (timedelta(minutes=30), "Memory pressure increases", "Application performance degrades further"),
+)
+
 
 class DiagnosticsTool:
     """
@@ -24,11 +36,19 @@ class DiagnosticsTool:
     - Root cause analysis
     """
     
+    __slots__ = ("config", "timeout", "max_depth", "_tools", "_validators")
+    
     def __init__(self, config: Any):
         """Initialize diagnostics tool with configuration."""
         self.config = config
-        self.timeout = config.timeout if hasattr(config, 'timeout') else 30
-        self.max_depth = config.max_depth if hasattr(config, 'max_depth') else 5
+        self.timeout = getattr(config, 'timeout', 30)
+        self.max_depth = getattr(config, 'max_depth', 5)
+        
+        # Tool schemas are static, so compile their argument validators once
+        self._tools = self._build_tools()
+        self._validators = {
+            tool.name: fastjsonschema.compile(tool.inputSchema) for tool in self._tools
+        }
         
         logger.info("Initialized DiagnosticsTool")
     
@@ -39,6 +59,10 @@ class DiagnosticsTool:
         Returns:
             List of Tool objects representing diagnostic capabilities.
         """
+        return list(self._tools)
+    
+    def _build_tools(self) -> List[Tool]:
+        """Build the Tool definitions for all diagnostic capabilities."""
         tools = [
             Tool(
                 name="diagnose_health",
@@ -157,6 +181,43 @@ class DiagnosticsTool:
                     },
                     "required": ["resource_uri"]
                 }
+            ),
+            Tool(
+                name="diagnose_bundle",
+                description="Run several diagnostic tools concurrently and return all results",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calls": {
+                            "type": "array",
+                            "description": "Diagnostic tool calls to run in parallel",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "tool": {
+                                        "type": "string",
+                                        "enum": [
+                                            "diagnose_health",
+                                            "diagnose_performance",
+                                            "diagnose_errors",
+                                            "diagnose_root_cause",
+                                            "diagnose_dependencies"
+                                        ],
+                                        "description": "Name of the diagnostic tool"
+                                    },
+                                    "arguments": {
+                                        "type": "object",
+                                        "description": "Arguments for the diagnostic tool",
+                                        "default": {}
+                                    }
+                                },
+                                "required": ["tool"]
+                            },
+                            "minItems": 1
+                        }
+                    },
+                    "required": ["calls"]
+                }
             )
         ]
         
@@ -173,7 +234,19 @@ class DiagnosticsTool:
         Returns:
             Diagnostic results as a dictionary
         """
-        logger.info(f"Executing diagnostic tool: {tool_name}")
+        logger.info("Executing diagnostic tool: %s", tool_name)
+        
+        validator = self._validators.get(tool_name)
+        if validator is not None:
+            try:
+                # Validate a copy: fastjsonschema writes defaults into the
+                # data it checks, including nested objects
+                arguments = validator(copy.deepcopy(arguments))
+            except fastjsonschema.JsonSchemaValueException as e:
+                return {
+                    "error": f"Invalid arguments for {tool_name}: {e.message}",
+                    "tool": tool_name
+                }
         
         if tool_name == "diagnose_health":
             return await self._diagnose_health(arguments)
@@ -185,9 +258,41 @@ class DiagnosticsTool:
             return await self._diagnose_root_cause(arguments)
         elif tool_name == "diagnose_dependencies":
             return await self._diagnose_dependencies(arguments)
+        elif tool_name == "diagnose_bundle":
+            return await self._diagnose_bundle(arguments)
         else:
             return {"error": f"Unknown diagnostic tool: {tool_name}"}
     
+    async def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Execute several diagnostic tools concurrently.
+        
+        Args:
+            calls: List of (tool_name, arguments) pairs
+        
+        Returns:
+            Diagnostic results in the same order as ``calls``; failed calls
+            are reported as error results
+        """
+        return await gather_settled(
+            calls,
+            lambda call: self.execute(*call),
+            lambda call, e: {"error": str(e), "tool": call[0]}
+        )
+    
+    async def _diagnose_bundle(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a bundle of diagnostic tools concurrently."""
+        calls = [(call["tool"], call.get("arguments", {})) for call in args.get("calls", [])]
+        
+        results = await self.execute_many(calls)
+        
+        return {
+            "tool": "diagnose_bundle",
+            "timestamp": datetime.utcnow().isoformat(),
+            "total_calls": len(calls),
+            "results": results
+        }
+    
     async def _diagnose_health(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Perform health check diagnosis."""
         resource_uri = args.get("resource_uri")
@@ -395,14 +500,15 @@ class DiagnosticsTool:
     
     async def _diagnose_root_cause(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Perform root cause analysis."""
-        incident_id = args.get("incident_id", f"INC-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}")
+        now = datetime.utcnow()
+        incident_id = args.get("incident_id", f"INC-{now.strftime('%Y%m%d%H%M%S')}")
         symptoms = args.get("symptoms", [])
         affected_resources = args.get("affected_resources", [])
         
         return {
             "tool": "diagnose_root_cause",
             "incident_id": incident_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "symptoms": symptoms,
             "affected_resources": affected_resources,
             "analysis": {
@@ -430,26 +536,8 @@ class DiagnosticsTool:
                     }
                 ],
                 "timeline": [
-                    {
-                        "time": (datetime.utcnow() - timedelta(hours=2)).isoformat(),
-                        "event": "Traffic spike begins",
-                        "impact": "Increased database connections"
-                    },
-                    {
-                        "time": (datetime.utcnow() - timedelta(hours=1, minutes=30)).isoformat(),
-                        "event": "Connection pool reaches capacity",
-                        "impact": "New requests start timing out"
-                    },
-                    {
-                        "time": (datetime.utcnow() - timedelta(hours=1)).isoformat(),
-                        "event": "Error rate exceeds threshold",
-                        "impact": "Service degradation visible to users"
-                    },
-                    {
-                        "time": (datetime.utcnow() - timedelta(minutes=30)).isoformat(),
-                        "event": "Memory pressure increases",
-                        "impact": "Application performance degrades further"
-                    }
+                    {"time": (now - offset).isoformat(), "event": event, "impact": impact}
+                    for offset, event, impact in _ROOT_CAUSE_TIMELINE
                 ],
                 "impact_assessment": {
                     "severity": "high",
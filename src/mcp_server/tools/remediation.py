@@ -5,16 +5,530 @@ Provides tools for automatically remediating infrastructure issues
 with safety guardrails and approval workflows.
 """
 
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import random
+import time
+from functools import partial
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Any, Awaitable, Callable, Deque, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta
+from enum import IntEnum
+from types import MappingProxyType
 from mcp.types import Tool
 import asyncio
 
+import fastjsonschema
+
+from .base import SimulatedTool
+
+from ...utils.serialization import deserialize, serialize
+
 logger = logging.getLogger(__name__)
 
+# Static tool metadata, shared by every RemediationTool instance
+_TOOL_DESCRIPTIONS: Dict[str, str] = {
+    "remediate_restart_service": "Restart a service or application instance",
+    "remediate_scale_up": "Scale up resources (add instances, increase capacity)",
+    "remediate_scale_down": "Scale down resources (remove instances, decrease capacity)",
+    "remediate_clear_cache": "Clear cache to resolve stale data issues",
+    "remediate_update_config": "Update configuration to resolve issues",
+    "remediate_restart_pod": "Restart a Kubernetes pod",
+    "remediate_kill_process": "Kill a problematic process",
+}
+
+_TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "remediate_restart_service": {
+        "type": "object",
+        "properties": {
+            "resource_uri": {
+                "type": "string",
+                "description": "Resource to restart (e.g., 'infra://aws/ec2/i-12345')"
+            },
+            "force": {
+                "type": "boolean",
+                "description": "Force restart without graceful shutdown",
+                "default": False
+            },
+            "reason": {
+                "type": "string",
+                "description": "Reason for restart"
+            }
+        },
+        "required": ["resource_uri", "reason"]
+    },
+    "remediate_scale_up": {
+        "type": "object",
+        "properties": {
+            "resource_uri": {
+                "type": "string",
+                "description": "Resource to scale"
+            },
+            "target_capacity": {
+                "type": "integer",
+                "description": "Target number of instances or capacity units",
+                "minimum": 1
+            },
+            "reason": {
+                "type": "string",
+                "description": "Reason for scaling"
+            }
+        },
+        "required": ["resource_uri", "target_capacity", "reason"]
+    },
+    "remediate_scale_down": {
+        "type": "object",
+        "properties": {
+            "resource_uri": {
+                "type": "string",
+                "description": "Resource to scale down"
+            },
+            "target_capacity": {
+                "type": "integer",
+                "description": "Target number of instances",
+                "minimum": 0
+            },
+            "drain_timeout": {
+                "type": "integer",
+                "description": "Timeout for draining connections (seconds)",
+                "default": 300
+            },
+            "reason": {
+                "type": "string",
+                "description": "Reason for scaling down"
+            }
+        },
+        "required": ["resource_uri", "target_capacity", "reason"]
+    },
+    "remediate_clear_cache": {
+        "type": "object",
+        "properties": {
+            "cache_uri": {
+                "type": "string",
+                "description": "Cache resource URI"
+            },
+            "pattern": {
+                "type": "string",
+                "description": "Key pattern to clear (supports wildcards)",
+                "default": "*"
+            },
+            "reason": {
+                "type": "string",
+                "description": "Reason for clearing cache"
+            }
+        },
+        "required": ["cache_uri", "reason"]
+    },
+    "remediate_update_config": {
+        "type": "object",
+        "properties": {
+            "resource_uri": {
+                "type": "string",
+                "description": "Resource to update"
+            },
+            "config_changes": {
+                "type": "object",
+                "description": "Configuration changes to apply"
+            },
+            "restart_required": {
+                "type": "boolean",
+                "description": "Whether restart is needed after config change",
+                "default": True
+            },
+            "reason": {
+                "type": "string",
+                "description": "Reason for configuration update"
+            }
+        },
+        "required": ["resource_uri", "config_changes", "reason"]
+    },
+    "remediate_restart_pod": {
+        "type": "object",
+        "properties": {
+            "pod_name": {
+                "type": "string",
+                "description": "Name of the pod to restart"
+            },
+            "namespace": {
+                "type": "string",
+                "description": "Kubernetes namespace",
+                "default": "default"
+            },
+            "reason": {
+                "type": "string",
+                "description": "Reason for restart"
+            }
+        },
+        "required": ["pod_name", "reason"]
+    },
+    "remediate_kill_process": {
+        "type": "object",
+        "properties": {
+            "resource_uri": {
+                "type": "string",
+                "description": "Resource where process is running"
+            },
+            "process_id": {
+                "type": "integer",
+                "description": "Process ID to kill"
+            },
+            "signal": {
+                "type": "string",
+                "enum": ["SIGTERM", "SIGKILL"],
+                "description": "Signal to send",
+                "default": "SIGTERM"
+            },
+            "reason": {
+                "type": "string",
+                "description": "Reason for killing process"
+            }
+        },
+        "required": ["resource_uri", "process_id", "reason"]
+    }
+}
+
+_TOOL_DEFINITIONS: List[Tool] = [
+    Tool(name=name, description=_TOOL_DESCRIPTIONS[name], inputSchema=schema)
+    for name, schema in _TOOL_SCHEMAS.items()
+]
+
+# Argument names accepted by each tool; any other keys are ignored
+_TOOL_FIELDS: Dict[str, FrozenSet[str]] = {
+    name: frozenset(schema["properties"]) for name, schema in _TOOL_SCHEMAS.items()
+}
+
+# Validators compiled once from the tool schemas
+_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    name: fastjsonschema.compile(schema) for name, schema in _TOOL_SCHEMAS.items()
+}
+
+# Static "details" of the simulated handler responses (see SimulatedTool)
+_RESTART_SERVICE_DETAILS = MappingProxyType({
+    "previous_state": "running",
+    "new_state": "running",
+    "restart_duration_seconds": 15,
+    "health_check_passed": True
+})
+
+_SCALE_UP_DETAILS = MappingProxyType({
+    "previous_capacity": 2,
+    "scaling_duration_seconds": 45,
+    "health_status": "healthy"
+})
+
+_SCALE_DOWN_DETAILS = MappingProxyType({
+    "previous_capacity": 5,
+    "terminated_instances": ("i-0987654321fedcba0", "i-1111222233334444"),
+    "connections_drained": True,
+    "scaling_duration_seconds": 35
+})
+
+_CLEAR_CACHE_DETAILS = MappingProxyType({
+    "keys_cleared": 1523,
+    "memory_freed_mb": 342.5,
+    "duration_seconds": 2.3,
+    "cache_hit_rate_before": 0.87,
+    "cache_hit_rate_after": 0.0
+})
+
+_UPDATE_CONFIG_DETAILS = MappingProxyType({
+    "backup_created": True,
+    "validation_passed": True
+})
+
+_RESTART_POD_DETAILS = MappingProxyType({
+    "restart_duration_seconds": 18,
+    "container_restarts": 0,
+    "health_check_passed": True,
+    "ready": True
+})
+
+_KILL_PROCESS_DETAILS = MappingProxyType({
+    "process_name": "java",
+    "process_user": "app",
+    "memory_usage_mb": 2048,
+    "cpu_percent": 95.2,
+    "termination_successful": True
+})
+
+
+# Response builders for the simulated actions. Each receives the completion
+# time, an ID factory and the tool arguments as keyword-only parameters.
+IdFactory = Callable[[str], str]
+
+
+def _build_restart_service(
+    now: datetime, new_id: IdFactory, *, resource_uri: str, reason: str, force: bool = False
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "restart_service",
+        "resource_uri": resource_uri,
+        "force": force,
+        "reason": reason,
+        "timestamp": now.isoformat(),
+        "details": {**_RESTART_SERVICE_DETAILS, "graceful_shutdown": not force},
+        "message": f"Successfully restarted service {resource_uri}"
+    }
+
+
+def _build_scale_up(
+    now: datetime, new_id: IdFactory, *, resource_uri: str, target_capacity: int, reason: str
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "scale_up",
+        "resource_uri": resource_uri,
+        "reason": reason,
+        "timestamp": now.isoformat(),
+        "details": {
+            **_SCALE_UP_DETAILS,
+            "target_capacity": target_capacity,
+            "current_capacity": target_capacity,
+            "new_instances": [new_id("i"), new_id("i")]
+        },
+        "message": f"Successfully scaled up {resource_uri} to {target_capacity} instances"
+    }
+
+
+def _build_scale_down(
+    now: datetime,
+    new_id: IdFactory,
+    *,
+    resource_uri: str,
+    target_capacity: int,
+    reason: str,
+    drain_timeout: int = 300
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "scale_down",
+        "resource_uri": resource_uri,
+        "reason": reason,
+        "timestamp": now.isoformat(),
+        "details": {
+            **_SCALE_DOWN_DETAILS,
+            "target_capacity": target_capacity,
+            "current_capacity": target_capacity,
+            "drain_timeout": drain_timeout
+        },
+        "message": f"Successfully scaled down {resource_uri} to {target_capacity} instances"
+    }
+
+
+def _build_clear_cache(
+    now: datetime, new_id: IdFactory, *, cache_uri: str, reason: str, pattern: str = "*"
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "clear_cache",
+        "cache_uri": cache_uri,
+        "pattern": pattern,
+        "reason": reason,
+        "timestamp": now.isoformat(),
+        "details": dict(_CLEAR_CACHE_DETAILS),
+        "message": f"Successfully cleared cache {cache_uri} with pattern {pattern}"
+    }
+
+
+def _build_update_config(
+    now: datetime,
+    new_id: IdFactory,
+    *,
+    resource_uri: str,
+    config_changes: Dict[str, Any],
+    reason: str,
+    restart_required: bool = True
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "update_config",
+        "resource_uri": resource_uri,
+        "reason": reason,
+        "timestamp": now.isoformat(),
+        "details": {
+            **_UPDATE_CONFIG_DETAILS,
+            "changes_applied": config_changes,
+            "backup_id": new_id("backup"),
+            "restart_required": restart_required
+        },
+        "message": f"Successfully updated configuration for {resource_uri}"
+    }
+
+
+def _build_restart_pod(
+    now: datetime, new_id: IdFactory, *, pod_name: str, reason: str, namespace: str = "default"
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "restart_pod",
+        "pod_name": pod_name,
+        "namespace": namespace,
+        "reason": reason,
+        "timestamp": now.isoformat(),
+        "details": {
+            **_RESTART_POD_DETAILS,
+            "previous_pod": pod_name,
+            "new_pod": f"{pod_name.rsplit('-', 1)[0]}-{now:%H%M%S}"
+        },
+        "message": f"Successfully restarted pod {namespace}/{pod_name}"
+    }
+
+
+def _build_kill_process(
+    now: datetime,
+    new_id: IdFactory,
+    *,
+    resource_uri: str,
+    process_id: int,
+    reason: str,
+    signal: str = "SIGTERM"
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "kill_process",
+        "resource_uri": resource_uri,
+        "process_id": process_id,
+        "signal": signal,
+        "reason": reason,
+        "timestamp": now.isoformat(),
+        "details": {**_KILL_PROCESS_DETAILS, "graceful_shutdown": signal == "SIGTERM"},
+        "message": f"Successfully killed process {process_id} on {resource_uri}"
+    }
+
+
+# Simulated actions: action type -> (simulated duration in seconds, builder)
+# TODO: Integrate with actual cloud providers
+_ACTIONS: Dict[str, Tuple[float, Callable[..., Dict[str, Any]]]] = {
+    "restart_service": (2, _build_restart_service),
+    "scale_up": (3, _build_scale_up),
+    "scale_down": (2, _build_scale_down),
+    "clear_cache": (1, _build_clear_cache),
+    "update_config": (2, _build_update_config),
+    "restart_pod": (2, _build_restart_pod),
+    "kill_process": (1, _build_kill_process),
+}
+
+
+# Record fields holding time.time_ns() values; rendered as ISO-8601 UTC
+# strings only when records are read back
+_TIMESTAMP_FIELDS = ("timestamp", "approved_at", "rejected_at", "completed_at", "failed_at")
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _format_ts(ns: int) -> str:
+    """Format a ``time.time_ns()`` value like ``datetime.utcnow().isoformat()``."""
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat()
 
-class RemediationTool:
+
+def _format_timestamps(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Format the epoch-ns timestamp fields of a record in place."""
+    for field in _TIMESTAMP_FIELDS:
+        value = record.get(field)
+        if isinstance(value, int):
+            record[field] = _format_ts(value)
+    return record
+
+
+def _decode_record(data: bytes) -> Dict[str, Any]:
+    """Decode a history snapshot, formatting its timestamp fields."""
+    record: Dict[str, Any] = deserialize(data)
+    return _format_timestamps(record)
+
+
+class TransientRemediationError(Exception):
+    """Raised by a remediation handler for failures that are safe to retry."""
+
+
+class RemediationStatus(IntEnum):
+    """Lifecycle state of a remediation record."""
+    PENDING = 0
+    AWAITING_APPROVAL = 1
+    APPROVED = 2
+    COMPLETED = 3
+    FAILED = 4
+    REJECTED = 5
+    
+    @property
+    def label(self) -> str:
+        """External name used in serialized records, e.g. ``awaiting_approval``."""
+        return self.name.lower()
+
+
+# Allowed status transitions; terminal states have none
+_TRANSITIONS: Dict[RemediationStatus, FrozenSet[RemediationStatus]] = {
+    RemediationStatus.PENDING: frozenset({
+        RemediationStatus.AWAITING_APPROVAL,
+        RemediationStatus.COMPLETED,
+        RemediationStatus.FAILED,
+    }),
+    RemediationStatus.AWAITING_APPROVAL: frozenset({
+        RemediationStatus.APPROVED,
+        RemediationStatus.REJECTED,
+    }),
+    RemediationStatus.APPROVED: frozenset({
+        RemediationStatus.COMPLETED,
+        RemediationStatus.FAILED,
+    }),
+    RemediationStatus.COMPLETED: frozenset(),
+    RemediationStatus.FAILED: frozenset(),
+    RemediationStatus.REJECTED: frozenset(),
+}
+
+
+class RemediationHistory:
+    """
+    Bounded remediation history stored as parallel columns.
+    
+    The fields used for filtering are kept in their own deques next to the
+    serialized snapshot, so lookups by ID or status never decode a record.
+    All columns share the same ``maxlen`` and stay aligned on eviction.
+    """
+    
+    __slots__ = ("ids", "statuses", "payloads")
+    
+    def __init__(self, maxlen: int):
+        self.ids: Deque[str] = deque(maxlen=maxlen)
+        self.statuses: Deque[RemediationStatus] = deque(maxlen=maxlen)
+        self.payloads: Deque[bytes] = deque(maxlen=maxlen)
+    
+    def __len__(self) -> int:
+        return len(self.payloads)
+    
+    def append(self, record: Dict[str, Any], data: bytes) -> None:
+        """Add a snapshot of ``record`` whose serialized form is ``data``."""
+        self.ids.append(record.get("remediation_id", ""))
+        self.statuses.append(record["status"])
+        self.payloads.append(data)
+    
+    def tail(self, limit: int) -> List[bytes]:
+        """Return the ``limit`` most recent snapshots, oldest first."""
+        start = max(0, len(self.payloads) - limit)
+        return list(islice(self.payloads, start, None))
+    
+    def select(
+        self,
+        remediation_id: Optional[str] = None,
+        status: Optional[RemediationStatus] = None
+    ) -> List[bytes]:
+        """Return the snapshots matching the given ID and/or status, oldest first."""
+        return [
+            data
+            for rid, st, data in zip(self.ids, self.statuses, self.payloads, strict=True)
+            if (remediation_id is None or rid == remediation_id)
+            and (status is None or st == status)
+        ]
+    
+    def latest(self, remediation_id: str) -> Optional[bytes]:
+        """Return the most recent snapshot of a remediation, if still held."""
+        for offset, rid in enumerate(reversed(self.ids), 1):
+            if rid == remediation_id:
+                return self.payloads[-offset]
+        return None
+
+
+class RemediationTool(SimulatedTool):
     """
     Remediation tools for infrastructure self-healing.
     
@@ -25,16 +539,69 @@ class RemediationTool:
     - Audit logging
     """
     
+    __slots__ = (
+        "config",
+        "require_approval",
+        "max_retries",
+        "retry_base_delay",
+        "retry_max_delay",
+        "rollback_on_failure",
+        "allowed_actions",
+        "history_max",
+        "max_inflight",
+        "_concurrency",
+        "_inflight",
+        "idempotency_ttl",
+        "idempotency_cache_size",
+        "_idem_cache",
+        "_idem_inflight",
+        "remediation_history",
+        "_pending_index",
+        "_dispatch",
+    )
+    
     def __init__(self, config: Any):
         """Initialize remediation tool with configuration."""
+        super().__init__(config)
         self.config = config
-        self.require_approval = config.require_approval if hasattr(config, 'require_approval') else True
-        self.max_retries = config.max_retries if hasattr(config, 'max_retries') else 3
-        self.rollback_on_failure = config.rollback_on_failure if hasattr(config, 'rollback_on_failure') else True
-        self.allowed_actions = config.allowed_actions if hasattr(config, 'allowed_actions') else []
+        self.require_approval = getattr(config, 'require_approval', True)
+        self.max_retries = getattr(config, 'max_retries', 3)
+        self.retry_base_delay = getattr(config, 'retry_base_delay', 1.0)
+        self.retry_max_delay = getattr(config, 'retry_max_delay', 30.0)
+        self.rollback_on_failure = getattr(config, 'rollback_on_failure', True)
+        self.allowed_actions: FrozenSet[str] = frozenset(getattr(config, 'allowed_actions', ()))
+        self.history_max = getattr(config, 'history_max', 10000)
+        self.max_inflight = getattr(config, 'max_inflight_remediations', 256)
+        
+        # Admission control: at most max_concurrent_remediations handlers run
+        # at once, and execute() rejects new work once max_inflight
+        # remediations are running or waiting for a slot
+        self._concurrency = asyncio.Semaphore(getattr(config, 'max_concurrent_remediations', 8))
+        self._inflight = 0
+        
+        # Completed results of recent requests, keyed by idempotency key and
+        # kept in LRU order, so retried requests are not executed twice
+        self.idempotency_ttl = getattr(config, 'idempotency_ttl', 60.0)
+        self.idempotency_cache_size = getattr(config, 'idempotency_cache_size', 1024)
+        self._idem_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        
+        # Requests currently running, keyed by idempotency key; concurrent
+        # duplicates await the first request's result instead of running again
+        self._idem_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        
+        # Track remediation history as serialized record snapshots, one per
+        # state transition (oldest snapshots are evicted once full)
+        self.remediation_history = RemediationHistory(self.history_max)
         
-        # Track remediation history
-        self.remediation_history: List[Dict[str, Any]] = []
+        # Live records awaiting approval, keyed by remediation ID. Updated
+        # without awaiting, like the history (see SimulatedTool)
+        self._pending_index: Dict[str, Dict[str, Any]] = {}
+        
+        # Map action types (tool names without the "remediate_" prefix) to handlers
+        self._dispatch: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+            action: partial(self._run, action) for action in _ACTIONS
+        }
+        self._dispatch["update_config"] = self._update_config
         
         logger.info("Initialized RemediationTool")
     
@@ -45,185 +612,7 @@ class RemediationTool:
         Returns:
             List of Tool objects representing remediation capabilities.
         """
-        tools = [
-            Tool(
-                name="remediate_restart_service",
-                description="Restart a service or application instance",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "resource_uri": {
-                            "type": "string",
-                            "description": "Resource to restart (e.g., 'infra://aws/ec2/i-12345')"
-                        },
-                        "force": {
-                            "type": "boolean",
-                            "description": "Force restart without graceful shutdown",
-                            "default": False
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for restart"
-                        }
-                    },
-                    "required": ["resource_uri", "reason"]
-                }
-            ),
-            Tool(
-                name="remediate_scale_up",
-                description="Scale up resources (add instances, increase capacity)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "resource_uri": {
-                            "type": "string",
-                            "description": "Resource to scale"
-                        },
-                        "target_capacity": {
-                            "type": "integer",
-                            "description": "Target number of instances or capacity units",
-                            "minimum": 1
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for scaling"
-                        }
-                    },
-                    "required": ["resource_uri", "target_capacity", "reason"]
-                }
-            ),
-            Tool(
-                name="remediate_scale_down",
-                description="Scale down resources (remove instances, decrease capacity)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "resource_uri": {
-                            "type": "string",
-                            "description": "Resource to scale down"
-                        },
-                        "target_capacity": {
-                            "type": "integer",
-                            "description": "Target number of instances",
-                            "minimum": 0
-                        },
-                        "drain_timeout": {
-                            "type": "integer",
-                            "description": "Timeout for draining connections (seconds)",
-                            "default": 300
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for scaling down"
-                        }
-                    },
-                    "required": ["resource_uri", "target_capacity", "reason"]
-                }
-            ),
-            Tool(
-                name="remediate_clear_cache",
-                description="Clear cache to resolve stale data issues",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "cache_uri": {
-                            "type": "string",
-                            "description": "Cache resource URI"
-                        },
-                        "pattern": {
-                            "type": "string",
-                            "description": "Key pattern to clear (supports wildcards)",
-                            "default": "*"
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for clearing cache"
-                        }
-                    },
-                    "required": ["cache_uri", "reason"]
-                }
-            ),
-            Tool(
-                name="remediate_update_config",
-                description="Update configuration to resolve issues",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "resource_uri": {
-                            "type": "string",
-                            "description": "Resource to update"
-                        },
-                        "config_changes": {
-                            "type": "object",
-                            "description": "Configuration changes to apply"
-                        },
-                        "restart_required": {
-                            "type": "boolean",
-                            "description": "Whether restart is needed after config change",
-                            "default": True
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for configuration update"
-                        }
-                    },
-                    "required": ["resource_uri", "config_changes", "reason"]
-                }
-            ),
-            Tool(
-                name="remediate_restart_pod",
-                description="Restart a Kubernetes pod",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pod_name": {
-                            "type": "string",
-                            "description": "Name of the pod to restart"
-                        },
-                        "namespace": {
-                            "type": "string",
-                            "description": "Kubernetes namespace",
-                            "default": "default"
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for restart"
-                        }
-                    },
-                    "required": ["pod_name", "reason"]
-                }
-            ),
-            Tool(
-                name="remediate_kill_process",
-                description="Kill a problematic process",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "resource_uri": {
-                            "type": "string",
-                            "description": "Resource where process is running"
-                        },
-                        "process_id": {
-                            "type": "integer",
-                            "description": "Process ID to kill"
-                        },
-                        "signal": {
-                            "type": "string",
-                            "enum": ["SIGTERM", "SIGKILL"],
-                            "description": "Signal to send",
-                            "default": "SIGTERM"
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for killing process"
-                        }
-                    },
-                    "required": ["resource_uri", "process_id", "reason"]
-                }
-            )
-        ]
-        
-        return tools
+        return _TOOL_DEFINITIONS
     
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -236,10 +625,10 @@ class RemediationTool:
         Returns:
             Remediation result with status and details
         """
-        logger.info(f"Executing remediation: {tool_name}")
+        logger.info("Executing remediation: %s", tool_name)
         
-        # Check if action is allowed
-        action_type = tool_name.replace("remediate_", "")
+        # Check if action is allowed before doing any other work
+        action_type = tool_name.removeprefix("remediate_")
         if self.allowed_actions and action_type not in self.allowed_actions:
             return {
                 "status": "rejected",
@@ -247,296 +636,296 @@ class RemediationTool:
                 "timestamp": datetime.utcnow().isoformat()
             }
         
-        # Create remediation record
-        remediation_id = f"REM-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+        # Keep only the schema fields, then validate and fill in defaults
+        fields = _TOOL_FIELDS.get(tool_name)
+        if fields is not None:
+            arguments = {key: value for key, value in arguments.items() if key in fields}
+            try:
+                arguments = _VALIDATORS[tool_name](arguments)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return {
+                    "status": "error",
+                    "error": f"Invalid arguments for {tool_name}: {e.message}",
+                    "tool": tool_name,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
         
-        remediation_record = {
-            "remediation_id": remediation_id,
-            "tool": tool_name,
-            "arguments": arguments,
-            "status": "pending",
-            "timestamp": datetime.utcnow().isoformat(),
-            "require_approval": self.require_approval
-        }
+        now_ns = time.time_ns()
         
         # Check if approval is required
         if self.require_approval:
-            remediation_record["status"] = "awaiting_approval"
-            self.remediation_history.append(remediation_record)
+            remediation_record = self._new_record(tool_name, arguments, now_ns)
+            self._transition(remediation_record, RemediationStatus.AWAITING_APPROVAL)
+            self._store_record(remediation_record)
+            self._pending_index[remediation_record["remediation_id"]] = remediation_record
             
             return {
                 "status": "awaiting_approval",
-                "remediation_id": remediation_id,
+                "remediation_id": remediation_record["remediation_id"],
                 "message": "Remediation action requires approval before execution",
                 "action": tool_name,
-                "details": arguments,
-                "timestamp": datetime.utcnow().isoformat()
+                "details": remediation_record["arguments"],
+                "timestamp": _format_ts(now_ns)
+            }
+        
+        # Replay the result of an identical request that completed recently
+        # or is still running
+        idem_key = self.idempotency_key(tool_name, arguments)
+        cached = self._idem_lookup(idem_key)
+        if cached is None and idem_key in self._idem_inflight:
+            cached = await asyncio.shield(self._idem_inflight[idem_key])
+        if cached is not None:
+            logger.info("Returning replayed result for duplicate %s request", tool_name)
+            return self._replay(tool_name, arguments, cached)
+        
+        # Shed load instead of queueing without bound
+        if self._inflight >= self.max_inflight:
+            logger.warning("Rejecting %s: %d remediations in flight", tool_name, self._inflight)
+            return {
+                "status": "rejected",
+                "reason": "overloaded",
+                "timestamp": _format_ts(now_ns)
             }
         
-        # Execute the remediation
+        # Execute the remediation, sharing the outcome with concurrent duplicates.
+        # If this request is cancelled the duplicates get a failed result
+        # rather than a CancelledError of their own.
+        remediation_record = self._new_record(tool_name, arguments, now_ns)
+        running: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._idem_inflight[idem_key] = running
         try:
-            if tool_name == "remediate_restart_service":
-                result = await self._restart_service(arguments)
-            elif tool_name == "remediate_scale_up":
-                result = await self._scale_up(arguments)
-            elif tool_name == "remediate_scale_down":
-                result = await self._scale_down(arguments)
-            elif tool_name == "remediate_clear_cache":
-                result = await self._clear_cache(arguments)
-            elif tool_name == "remediate_update_config":
-                result = await self._update_config(arguments)
-            elif tool_name == "remediate_restart_pod":
-                result = await self._restart_pod(arguments)
-            elif tool_name == "remediate_kill_process":
-                result = await self._kill_process(arguments)
-            else:
-                result = {
-                    "status": "error",
-                    "message": f"Unknown remediation tool: {tool_name}"
-                }
+            result = await self._run_record(remediation_record)
+        except BaseException as e:
+            running.set_result({
+                "status": "failed",
+                "remediation_id": remediation_record["remediation_id"],
+                "error": f"Original request did not finish: {e!r}",
+                "timestamp": _format_ts(time.time_ns())
+            })
+            raise
+        finally:
+            del self._idem_inflight[idem_key]
+        
+        running.set_result(result)
+        if result.get("status") == "completed":
+            self._idem_store(idem_key, result)
+        return result
+    
+    def _new_record(
+        self, tool_name: str, arguments: Dict[str, Any], now_ns: int, **extra: Any
+    ) -> Dict[str, Any]:
+        """Create a PENDING remediation record for a validated request."""
+        return {
+            "remediation_id": self._ids.new("REM"),
+            "tool": tool_name,
+            "arguments": MappingProxyType(arguments),
+            "status": RemediationStatus.PENDING,
+            "timestamp": now_ns,
+            "require_approval": self.require_approval,
+            **extra
+        }
+    
+    def _replay(self, tool_name: str, arguments: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record a duplicate request answered from another request's result.
+        
+        Args:
+            tool_name: Name of the remediation tool
+            arguments: Validated tool arguments
+            result: Result of the original request
+        
+        Returns:
+            Copy of the original result marked as replayed
+        """
+        now_ns = time.time_ns()
+        replay_record = self._new_record(tool_name, arguments, now_ns, replayed=True)
+        replay_record["result"] = result
+        if result.get("status") == "completed":
+            self._transition(replay_record, RemediationStatus.COMPLETED)
+            replay_record["completed_at"] = now_ns
+        else:
+            self._transition(replay_record, RemediationStatus.FAILED)
+            replay_record["failed_at"] = now_ns
+        self._store_record(replay_record)
+        
+        return {**result, "replayed": True}
+    
+    async def _run_record(self, remediation_record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the handler for a remediation record and store its outcome.
+        
+        Args:
+            remediation_record: Record to execute; updated in place
+        
+        Returns:
+            Handler result, or a failure summary if the handler raised
+        """
+        self._inflight += 1
+        try:
+            result = await self._dispatch_handler(
+                remediation_record["tool"], remediation_record["arguments"]
+            )
             
-            remediation_record["status"] = result.get("status", "completed")
+            self._transition(
+                remediation_record,
+                RemediationStatus.COMPLETED if result.get("status") == "completed" else RemediationStatus.FAILED
+            )
             remediation_record["result"] = result
-            remediation_record["completed_at"] = datetime.utcnow().isoformat()
-            self.remediation_history.append(remediation_record)
+            remediation_record["completed_at"] = time.time_ns()
+            self._store_record(remediation_record)
             
             return result
             
         except Exception as e:
-            logger.error(f"Remediation failed: {str(e)}")
-            remediation_record["status"] = "failed"
+            logger.error("Remediation failed: %s", e)
+            failed_at = time.time_ns()
+            self._transition(remediation_record, RemediationStatus.FAILED)
             remediation_record["error"] = str(e)
-            remediation_record["failed_at"] = datetime.utcnow().isoformat()
-            self.remediation_history.append(remediation_record)
+            remediation_record["failed_at"] = failed_at
+            self._store_record(remediation_record)
             
             return {
                 "status": "failed",
-                "remediation_id": remediation_id,
+                "remediation_id": remediation_record["remediation_id"],
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _format_ts(failed_at)
             }
+        finally:
+            self._inflight -= 1
     
-    async def _restart_service(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Restart a service or instance."""
-        resource_uri = args.get("resource_uri")
-        force = args.get("force", False)
-        reason = args.get("reason")
-        
-        # TODO: Integrate with actual cloud providers
-        # For now, simulate the restart
-        
-        logger.info(f"Restarting service: {resource_uri}")
-        
-        # Simulate restart delay
-        await asyncio.sleep(2)
+    async def _dispatch_handler(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Look up the handler for a remediation tool and run it with retries."""
+        handler = self._dispatch.get(tool_name.removeprefix("remediate_"))
+        if handler is None:
+            return {
+                "status": "error",
+                "message": f"Unknown remediation tool: {tool_name}"
+            }
         
-        return {
-            "status": "completed",
-            "action": "restart_service",
-            "resource_uri": resource_uri,
-            "force": force,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "previous_state": "running",
-                "new_state": "running",
-                "restart_duration_seconds": 15,
-                "graceful_shutdown": not force,
-                "health_check_passed": True
-            },
-            "message": f"Successfully restarted service {resource_uri}"
-        }
+        # Handlers take the schema fields as keyword-only parameters;
+        # execute() has already validated and filtered the arguments
+        return await self._retry(handler, **arguments)
     
-    async def _scale_up(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Scale up resources."""
-        resource_uri = args.get("resource_uri")
-        target_capacity = args.get("target_capacity")
-        reason = args.get("reason")
-        
-        logger.info(f"Scaling up: {resource_uri} to {target_capacity}")
-        
-        # Simulate scaling
-        await asyncio.sleep(3)
+    async def _retry(
+        self,
+        handler: Callable[..., Awaitable[Dict[str, Any]]],
+        *args: Any,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Run a handler, retrying transient failures with exponential backoff.
         
-        return {
-            "status": "completed",
-            "action": "scale_up",
-            "resource_uri": resource_uri,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "previous_capacity": 2,
-                "target_capacity": target_capacity,
-                "current_capacity": target_capacity,
-                "scaling_duration_seconds": 45,
-                "new_instances": [
-                    f"i-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-001",
-                    f"i-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-002"
-                ],
-                "health_status": "healthy"
-            },
-            "message": f"Successfully scaled up {resource_uri} to {target_capacity} instances"
-        }
-    
-    async def _scale_down(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Scale down resources."""
-        resource_uri = args.get("resource_uri")
-        target_capacity = args.get("target_capacity")
-        drain_timeout = args.get("drain_timeout", 300)
-        reason = args.get("reason")
+        Uses full jitter: before retry ``n`` the delay is drawn uniformly from
+        ``[0, min(retry_max_delay, retry_base_delay * 2**n)]`` so concurrent
+        retries against an overloaded target are spread out. Each attempt
+        holds a concurrency slot; the slot is released while backing off.
         
-        logger.info(f"Scaling down: {resource_uri} to {target_capacity}")
+        Args:
+            handler: Remediation coroutine function to call
+            *args: Positional arguments for the handler
+            **kwargs: Keyword arguments for the handler
         
-        # Simulate scaling
-        await asyncio.sleep(2)
+        Returns:
+            The handler result
         
-        return {
-            "status": "completed",
-            "action": "scale_down",
-            "resource_uri": resource_uri,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "previous_capacity": 5,
-                "target_capacity": target_capacity,
-                "current_capacity": target_capacity,
-                "drain_timeout": drain_timeout,
-                "terminated_instances": [
-                    "i-0987654321fedcba0",
-                    "i-1111222233334444"
-                ],
-                "connections_drained": True,
-                "scaling_duration_seconds": 35
-            },
-            "message": f"Successfully scaled down {resource_uri} to {target_capacity} instances"
-        }
+        Raises:
+            TransientRemediationError: If the last allowed attempt still fails
+        """
+        attempt = 0
+        while True:
+            async with self._concurrency:
+                try:
+                    return await handler(*args, **kwargs)
+                except TransientRemediationError as e:
+                    if attempt >= self.max_retries:
+                        raise
+                    error = e
+            
+            delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+            logger.warning(
+                "Transient remediation failure (attempt %d/%d), retrying in %.2fs: %s",
+                attempt + 1, self.max_retries + 1, delay, error
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
     
-    async def _clear_cache(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Clear cache entries."""
-        cache_uri = args.get("cache_uri")
-        pattern = args.get("pattern", "*")
-        reason = args.get("reason")
+    async def _run(self, action: str, **arguments: Any) -> Dict[str, Any]:
+        """Run a simulated action from the ``_ACTIONS`` table."""
+        delay, builder = _ACTIONS[action]
         
-        logger.info(f"Clearing cache: {cache_uri} pattern: {pattern}")
+        logger.info("Running %s: %s", action, arguments)
         
-        # Simulate cache clear
-        await asyncio.sleep(1)
+        await self._simulate_work(delay)
         
-        return {
-            "status": "completed",
-            "action": "clear_cache",
-            "cache_uri": cache_uri,
-            "pattern": pattern,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "keys_cleared": 1523,
-                "memory_freed_mb": 342.5,
-                "duration_seconds": 2.3,
-                "cache_hit_rate_before": 0.87,
-                "cache_hit_rate_after": 0.0
-            },
-            "message": f"Successfully cleared cache {cache_uri} with pattern {pattern}"
-        }
+        return builder(datetime.utcnow(), self._ids.new, **arguments)
     
-    async def _update_config(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Update configuration."""
-        resource_uri = args.get("resource_uri")
-        config_changes = args.get("config_changes")
-        restart_required = args.get("restart_required", True)
-        reason = args.get("reason")
-        
-        logger.info(f"Updating config: {resource_uri}")
-        
-        # Simulate config update
-        await asyncio.sleep(2)
-        
-        result = {
-            "status": "completed",
-            "action": "update_config",
-            "resource_uri": resource_uri,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "changes_applied": config_changes,
-                "backup_created": True,
-                "backup_id": f"backup-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
-                "restart_required": restart_required,
-                "validation_passed": True
-            },
-            "message": f"Successfully updated configuration for {resource_uri}"
-        }
+    async def _update_config(self, **arguments: Any) -> Dict[str, Any]:
+        """Update configuration, restarting the resource if required."""
+        result = await self._run("update_config", **arguments)
         
         # If restart is required, perform it
-        if restart_required:
-            restart_result = await self._restart_service({
-                "resource_uri": resource_uri,
-                "force": False,
-                "reason": "Configuration update requires restart"
-            })
-            result["details"]["restart_result"] = restart_result
+        if result["details"]["restart_required"]:
+            result["details"]["restart_result"] = await self._run(
+                "restart_service",
+                resource_uri=result["resource_uri"],
+                reason="Configuration update requires restart"
+            )
         
         return result
     
-    async def _restart_pod(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Restart a Kubernetes pod."""
-        pod_name = args.get("pod_name")
-        namespace = args.get("namespace", "default")
-        reason = args.get("reason")
-        
-        logger.info(f"Restarting pod: {namespace}/{pod_name}")
+    @staticmethod
+    def idempotency_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+        """
+        Compute the idempotency key of a request.
         
-        # Simulate pod restart
-        await asyncio.sleep(2)
+        Args:
+            tool_name: Name of the remediation tool
+            arguments: Tool arguments; key order does not matter
         
-        return {
-            "status": "completed",
-            "action": "restart_pod",
-            "pod_name": pod_name,
-            "namespace": namespace,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "previous_pod": pod_name,
-                "new_pod": f"{pod_name.rsplit('-', 1)[0]}-{datetime.utcnow().strftime('%H%M%S')}",
-                "restart_duration_seconds": 18,
-                "container_restarts": 0,
-                "health_check_passed": True,
-                "ready": True
-            },
-            "message": f"Successfully restarted pod {namespace}/{pod_name}"
-        }
+        Returns:
+            Hex digest identifying the (tool, arguments) pair
+        """
+        digest = hashlib.blake2b(tool_name.encode(), digest_size=16)
+        digest.update(serialize(arguments, sort_keys=True))
+        return digest.hexdigest()
     
-    async def _kill_process(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Kill a problematic process."""
-        resource_uri = args.get("resource_uri")
-        process_id = args.get("process_id")
-        signal = args.get("signal", "SIGTERM")
-        reason = args.get("reason")
-        
-        logger.info(f"Killing process {process_id} on {resource_uri} with {signal}")
+    def _idem_lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a key if it has not expired."""
+        entry = self._idem_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._idem_cache[key]
+            return None
+        self._idem_cache.move_to_end(key)
+        return result
+    
+    def _idem_store(self, key: str, result: Dict[str, Any]) -> None:
+        """Cache a completed result, evicting the least recently used entries."""
+        if self.idempotency_ttl <= 0 or self.idempotency_cache_size <= 0:
+            return
+        self._idem_cache[key] = (time.monotonic() + self.idempotency_ttl, result)
+        self._idem_cache.move_to_end(key)
+        while len(self._idem_cache) > self.idempotency_cache_size:
+            self._idem_cache.popitem(last=False)
+    
+    def invalidate(self, key: Optional[str] = None) -> bool:
+        """
+        Drop a cached result so the next identical request runs again.
         
-        # Simulate process kill
-        await asyncio.sleep(1)
+        Args:
+            key: Idempotency key from ``idempotency_key``; clears the whole
+                cache if omitted
         
-        return {
-            "status": "completed",
-            "action": "kill_process",
-            "resource_uri": resource_uri,
-            "process_id": process_id,
-            "signal": signal,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "process_name": "java",
-                "process_user": "app",
-                "memory_usage_mb": 2048,
-                "cpu_percent": 95.2,
-                "termination_successful": True,
-                "graceful_shutdown": signal == "SIGTERM"
-            },
-            "message": f"Successfully killed process {process_id} on {resource_uri}"
-        }
+        Returns:
+            True if anything was removed
+        """
+        if key is None:
+            removed = bool(self._idem_cache)
+            self._idem_cache.clear()
+            return removed
+        return self._idem_cache.pop(key, None) is not None
     
     def register_action(self, action: Dict[str, Any]) -> None:
         """
@@ -547,8 +936,8 @@ class RemediationTool:
         """
         action_name = action.get("name")
         if action_name:
-            self.allowed_actions.append(action_name)
-            logger.info(f"Registered custom remediation action: {action_name}")
+            self.allowed_actions = self.allowed_actions | {action_name}
+            logger.info("Registered custom remediation action: %s", action_name)
     
     def get_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -560,7 +949,62 @@ class RemediationTool:
         Returns:
             List of remediation records
         """
-        return self.remediation_history[-limit:]
+        return [_decode_record(data) for data in self.remediation_history.tail(limit)]
+    
+    def query_history(
+        self,
+        remediation_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream decoded remediation records, oldest first.
+        
+        Args:
+            remediation_id: Only yield snapshots of this remediation
+            status: Only yield snapshots with this status
+        
+        Yields:
+            Matching remediation records
+        """
+        status_code = None
+        if status is not None:
+            try:
+                status_code = RemediationStatus[status.upper()]
+            except KeyError:
+                return
+        
+        for data in self.remediation_history.select(remediation_id, status_code):
+            yield _decode_record(data)
+    
+    def _transition(self, record: Dict[str, Any], status: RemediationStatus) -> None:
+        """
+        Move a record to a new status.
+        
+        Raises:
+            ValueError: If the transition is not allowed from the current status
+        """
+        current = record["status"]
+        if status not in _TRANSITIONS[current]:
+            raise ValueError(f"Invalid remediation status transition: {current.label} -> {status.label}")
+        record["status"] = status
+    
+    def _store_record(self, record: Dict[str, Any]) -> None:
+        """
+        Serialize a snapshot of a record into the history and the audit log.
+        
+        Deliberately synchronous so the append is atomic on the event loop.
+        """
+        snapshot = {**record, "status": record["status"].label}
+        self.remediation_history.append(record, serialize(snapshot))
+        if self._audit_log is not None:
+            # History keeps epoch-ns timestamps; the audit log gets ISO-8601
+            # like every other timestamp written there
+            self._audit_log.write(serialize(_format_timestamps(snapshot)))
+    
+    def _find_latest(self, remediation_id: str) -> Optional[Dict[str, Any]]:
+        """Decode the most recent snapshot of a remediation, if still in history."""
+        data = self.remediation_history.latest(remediation_id)
+        return _decode_record(data) if data is not None else None
     
     async def approve_remediation(self, remediation_id: str, approved_by: str) -> Dict[str, Any]:
         """
@@ -573,42 +1017,31 @@ class RemediationTool:
         Returns:
             Result of the approved remediation
         """
-        # Find the pending remediation
-        remediation = None
-        for record in self.remediation_history:
-            if record.get("remediation_id") == remediation_id:
-                remediation = record
-                break
-        
-        if not remediation:
-            return {
-                "status": "error",
-                "message": f"Remediation {remediation_id} not found"
-            }
-        
-        if remediation.get("status") != "awaiting_approval":
+        # Only indexed remediations are awaiting approval; fall back to
+        # history only to report why any other ID cannot be approved
+        remediation = self._pending_index.pop(remediation_id, None)
+        if remediation is None:
+            latest = self._find_latest(remediation_id)
+            if latest is None:
+                return {
+                    "status": "error",
+                    "message": f"Remediation {remediation_id} not found"
+                }
             return {
                 "status": "error",
-                "message": f"Remediation {remediation_id} is not awaiting approval (status: {remediation.get('status')})"
+                "message": f"Remediation {remediation_id} is not awaiting approval (status: {latest.get('status')})"
             }
         
         # Execute the approved remediation
-        logger.info(f"Executing approved remediation {remediation_id}")
-        remediation["status"] = "approved"
+        logger.info("Executing approved remediation %s", remediation_id)
+        self._transition(remediation, RemediationStatus.APPROVED)
         remediation["approved_by"] = approved_by
-        remediation["approved_at"] = datetime.utcnow().isoformat()
+        remediation["approved_at"] = time.time_ns()
+        self._store_record(remediation)
         
-        # Temporarily disable approval requirement
-        original_require_approval = self.require_approval
-        self.require_approval = False
-        
-        try:
-            result = await self.execute(remediation["tool"], remediation["arguments"])
-            remediation["status"] = "completed"
-            remediation["result"] = result
-            return result
-        finally:
-            self.require_approval = original_require_approval
+        # Run the handler on the original record; the allowed_actions check
+        # already passed when the remediation was requested
+        return await self._run_record(remediation)
     
     async def reject_remediation(self, remediation_id: str, rejected_by: str, reason: str) -> Dict[str, Any]:
         """
@@ -622,35 +1055,32 @@ class RemediationTool:
         Returns:
             Rejection confirmation
         """
-        # Find the pending remediation
-        remediation = None
-        for record in self.remediation_history:
-            if record.get("remediation_id") == remediation_id:
-                remediation = record
-                break
-        
-        if not remediation:
-            return {
-                "status": "error",
-                "message": f"Remediation {remediation_id} not found"
-            }
-        
-        if remediation.get("status") != "awaiting_approval":
+        # Only indexed remediations are awaiting approval; fall back to
+        # history only to report why any other ID cannot be rejected
+        remediation = self._pending_index.pop(remediation_id, None)
+        if remediation is None:
+            if self._find_latest(remediation_id) is None:
+                return {
+                    "status": "error",
+                    "message": f"Remediation {remediation_id} not found"
+                }
             return {
                 "status": "error",
                 "message": f"Remediation {remediation_id} is not awaiting approval"
             }
         
-        logger.info(f"Rejecting remediation {remediation_id}")
-        remediation["status"] = "rejected"
+        logger.info("Rejecting remediation %s", remediation_id)
+        rejected_at = time.time_ns()
+        self._transition(remediation, RemediationStatus.REJECTED)
         remediation["rejected_by"] = rejected_by
-        remediation["rejected_at"] = datetime.utcnow().isoformat()
+        remediation["rejected_at"] = rejected_at
         remediation["rejection_reason"] = reason
+        self._store_record(remediation)
         
         return {
             "status": "rejected",
             "remediation_id": remediation_id,
             "rejected_by": rejected_by,
             "reason": reason,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _format_ts(rejected_at)
         }
\ No newline at end of file
@@ -5,16 +5,201 @@ Provides tools for rolling back failed remediation actions
 and restoring previous system states.
 """
 
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import (
+    TYPE_CHECKING, Awaitable, Callable, List, Dict, Any, Deque, Iterator, Mapping, NamedTuple, Optional, Tuple
+)
 from datetime import datetime, timedelta
-from mcp.types import Tool
-import asyncio
+from types import MappingProxyType
+
+from ...utils.concurrency import gather_settled
+from ...utils.serialization import serialize
+from .base import SimulatedTool
+
+if TYPE_CHECKING:
+    from mcp.types import Tool
 
 logger = logging.getLogger(__name__)
 
+# Static "details" of the simulated rollback responses (see SimulatedTool)
+_REMEDIATION_ROLLBACK_DETAILS = MappingProxyType({
+    "previous_action": "restart_service",
+    "rollback_action": "restore_previous_state",
+    "duration_seconds": 12,
+    "resources_affected": ("i-1234567890abcdef0",),
+    "state_restored": True,
+    "health_check_passed": True
+})
+
+_CONFIG_ROLLBACK_DETAILS = MappingProxyType({
+    "config_restored": True,
+    "changes_reverted": MappingProxyType({
+        "connection_pool_size": MappingProxyType({"from": 50, "to": 20}),
+        "timeout": MappingProxyType({"from": 60, "to": 30})
+    }),
+    "restart_required": True,
+    "restart_performed": True,
+    "validation_passed": True
+})
+
+_DEPLOYMENT_ROLLBACK_DETAILS = MappingProxyType({
+    "current_version": "v1.2.4",
+    "rollback_strategy": "blue_green",
+    "pods_updated": 5,
+    "rollback_duration_seconds": 45,
+    "zero_downtime": True,
+    "health_checks_passed": True,
+    "traffic_switched": True
+})
+
+_SCALE_ROLLBACK_DETAILS = MappingProxyType({
+    "current_capacity": 5,
+    "scaling_duration_seconds": 30,
+    "instances_terminated": 2,
+    "health_status": "healthy"
+})
+
+# Mock rollback points: (sequence number, age, type, description, state)
+_MOCK_ROLLBACK_POINTS: Tuple[Tuple[int, timedelta, str, str, Mapping[str, Any]], ...] = (
+    (1, timedelta(hours=1), "auto", "Pre-scaling snapshot", MappingProxyType({
+        "capacity": 3,
+        "instance_type": "t3.medium",
+        "auto_scaling": True
+    })),
+    (2, timedelta(hours=3), "manual", "Before config update", MappingProxyType({
+        "config_version": "v1.2.3",
+        "connection_pool": 20
+    })),
+    (3, timedelta(days=1), "auto", "Daily backup", MappingProxyType({
+        "capacity": 2,
+        "instance_type": "t3.small"
+    })),
+)
+
+# Mock resource state captured by every snapshot; shared read-only rather
+# than allocated per snapshot
+_MOCK_SNAPSHOT_STATE = MappingProxyType({
+    "capacity": 3,
+    "instance_type": "t3.medium",
+    "auto_scaling_enabled": True,
+    "config_version": "v1.2.4",
+    "health_status": "healthy"
+})
+
+
+
+class _StateDelta(NamedTuple):
+    """Snapshot state stored as changes against a shared base state."""
+    base: Mapping[str, Any]
+    changed: Dict[str, Any]
+    removed: Tuple[str, ...]
+    
+    def resolve(self) -> Dict[str, Any]:
+        """Rebuild the full state."""
+        state = {**self.base, **self.changed}
+        for key in self.removed:
+            del state[key]
+        return state
+
+
+# Previous scaling state assumed when no snapshot is given
+_DEFAULT_SCALE_STATE = MappingProxyType({
+    "capacity": 3,
+    "instance_type": "t3.medium",
+    "auto_scaling_enabled": True
+})
+
+
+# Response builders for the simulated rollbacks. Only the per-call values
+# are passed in; the fixed shape and static fields live here.
+def _build_remediation_rollback(
+    iso: str, rollback_id: str, remediation_id: Optional[str], reason: Optional[str]
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "rollback_id": rollback_id,
+        "remediation_id": remediation_id,
+        "reason": reason,
+        "timestamp": iso,
+        "details": dict(_REMEDIATION_ROLLBACK_DETAILS),
+        "message": f"Successfully rolled back remediation {remediation_id}"
+    }
+
+
+def _build_config_rollback(
+    now: datetime, resource_uri: Optional[str], backup_id: Optional[str], reason: Optional[str]
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "rollback_config",
+        "resource_uri": resource_uri,
+        "backup_id": backup_id,
+        "reason": reason,
+        "timestamp": now.isoformat(),
+        "details": {
+            **_CONFIG_ROLLBACK_DETAILS,
+            "backup_timestamp": (now - timedelta(hours=2)).isoformat()
+        },
+        "message": f"Successfully restored configuration from backup {backup_id}"
+    }
+
+
+def _build_deployment_rollback(
+    iso: str, deployment_uri: Optional[str], target_version: str, reason: Optional[str]
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "rollback_deployment",
+        "deployment_uri": deployment_uri,
+        "target_version": target_version,
+        "reason": reason,
+        "timestamp": iso,
+        "details": {**_DEPLOYMENT_ROLLBACK_DETAILS, "target_version": target_version},
+        "message": f"Successfully rolled back deployment to version {target_version}"
+    }
+
 
-class RollbackTool:
+def _build_scale_rollback(
+    iso: str,
+    resource_uri: Optional[str],
+    snapshot_id: Optional[str],
+    reason: Optional[str],
+    restored: Mapping[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "action": "rollback_scale",
+        "resource_uri": resource_uri,
+        "snapshot_id": snapshot_id,
+        "reason": reason,
+        "timestamp": iso,
+        "details": {
+            **_SCALE_ROLLBACK_DETAILS,
+            "restored_capacity": restored.get("capacity", 3),
+            "auto_scaling_restored": restored.get("auto_scaling_enabled", True)
+        },
+        "message": "Successfully restored scaling configuration"
+    }
+
+
+def _build_snapshot_created(
+    iso: str, snapshot_id: str, resource_uri: Optional[str], description: str
+) -> Dict[str, Any]:
+    return {
+        "status": "completed",
+        "snapshot_id": snapshot_id,
+        "resource_uri": resource_uri,
+        "description": description,
+        "timestamp": iso,
+        "message": f"Successfully created snapshot {snapshot_id}"
+    }
+
+
+class RollbackTool(SimulatedTool):
     """
     Rollback tools for reversing failed changes.
     
@@ -25,22 +210,63 @@ class RollbackTool:
     - Audit trail maintenance
     """
     
+    __slots__ = (
+        "config",
+        "enabled",
+        "history_retention_days",
+        "auto_rollback",
+        "rollback_history",
+        "state_snapshots",
+        "_snapshot_cap",
+        "_snapshot_created",
+        "_snapshot_heap",
+        "_snapshot_bases",
+        "_tools",
+        "_dispatch",
+    )
+    
     def __init__(self, config: Any):
         """Initialize rollback tool with configuration."""
+        super().__init__(config)
         self.config = config
-        self.enabled = config.enabled if hasattr(config, 'enabled') else True
-        self.history_retention_days = config.history_retention_days if hasattr(config, 'history_retention_days') else 7
-        self.auto_rollback = config.auto_rollback_on_failure if hasattr(config, 'auto_rollback_on_failure') else True
-        
-        # Track rollback history
-        self.rollback_history: List[Dict[str, Any]] = []
-        
-        # Store state snapshots for rollback
-        self.state_snapshots: Dict[str, Dict[str, Any]] = {}
+        self.enabled = getattr(config, 'enabled', True)
+        self.history_retention_days = getattr(config, 'history_retention_days', 7)
+        self.auto_rollback = getattr(config, 'auto_rollback_on_failure', True)
+        
+        # Track rollback history (oldest records are evicted once full)
+        self.rollback_history: Deque[Dict[str, Any]] = deque(maxlen=getattr(config, 'history_max', 10000))
+        
+        # Store state snapshots for rollback, least recently used first
+        self.state_snapshots: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._snapshot_cap = getattr(config, 'snapshot_max', 1000)
+        
+        # Creation time (epoch seconds) of each stored snapshot, plus a min-heap of
+        # (created, snapshot_id) so expiry only visits expired snapshots.
+        # Heap entries whose snapshot was evicted or replaced are skipped.
+        self._snapshot_created: Dict[str, float] = {}
+        self._snapshot_heap: List[Tuple[float, str]] = []
+        
+        # Base state per resource; snapshots store only their changes
+        # against it (see _diff_state). History and snapshot state are
+        # updated without awaiting (see SimulatedTool)
+        self._snapshot_bases: Dict[Optional[str], Mapping[str, Any]] = {}
+        
+        # Tool definitions never change; built on the first list_tools call
+        self._tools: Optional[Tuple["Tool", ...]] = None
+        
+        # Map tool names to handlers
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+            "rollback_remediation": self._rollback_remediation,
+            "rollback_config": self._rollback_config,
+            "rollback_deployment": self._rollback_deployment,
+            "rollback_scale": self._rollback_scale,
+            "rollback_list_available": self._list_available_rollbacks,
+            "rollback_create_snapshot": self._create_snapshot,
+        }
         
         logger.info("Initialized RollbackTool")
     
-    async def list_tools(self) -> List[Tool]:
+    async def list_tools(self) -> List["Tool"]:
         """
         List all available rollback tools.
         
@@ -50,6 +276,15 @@ class RollbackTool:
         if not self.enabled:
             return []
         
+        if self._tools is None:
+            self._tools = tuple(self._build_tools())
+        return list(self._tools)
+    
+    def _build_tools(self) -> List["Tool"]:
+        """Build the Tool definitions for all rollback capabilities."""
+        # Imported here so callers that only execute rollbacks never load it
+        from mcp.types import Tool
+        
         tools = [
             Tool(
                 name="rollback_remediation",
@@ -153,6 +388,7 @@ class RollbackTool:
                         "limit": {
                             "type": "integer",
                             "description": "Maximum number of rollback points to return",
+                            "minimum": 0,
                             "default": 10
                         }
                     }
@@ -197,26 +433,16 @@ class RollbackTool:
                 "message": "Rollback operations are disabled"
             }
         
-        logger.info(f"Executing rollback: {tool_name}")
+        logger.info("Executing rollback: %s", tool_name)
+        
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
+            return {"error": f"Unknown rollback tool: {tool_name}"}
         
         try:
-            if tool_name == "rollback_remediation":
-                return await self._rollback_remediation(arguments)
-            elif tool_name == "rollback_config":
-                return await self._rollback_config(arguments)
-            elif tool_name == "rollback_deployment":
-                return await self._rollback_deployment(arguments)
-            elif tool_name == "rollback_scale":
-                return await self._rollback_scale(arguments)
-            elif tool_name == "rollback_list_available":
-                return await self._list_available_rollbacks(arguments)
-            elif tool_name == "rollback_create_snapshot":
-                return await self._create_snapshot(arguments)
-            else:
-                return {"error": f"Unknown rollback tool: {tool_name}"}
-                
+            return await handler(arguments)
         except Exception as e:
-            logger.error(f"Rollback failed: {str(e)}")
+            logger.error("Rollback failed: %s", e)
             return {
                 "status": "failed",
                 "error": str(e),
@@ -229,40 +455,28 @@ class RollbackTool:
         reason = args.get("reason")
         force = args.get("force", False)
         
-        logger.info(f"Rolling back remediation: {remediation_id}")
+        logger.info("Rolling back remediation: %s", remediation_id)
         
         # TODO: Look up the actual remediation from history
         # For now, simulate rollback
         
         # Simulate rollback operation
-        await asyncio.sleep(2)
+        await self._simulate_work(2)
+        now = datetime.utcnow()
+        iso = now.isoformat()
+        rollback_id = self._ids.new("RB")
         
         rollback_record = {
-            "rollback_id": f"RB-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+            "rollback_id": rollback_id,
             "remediation_id": remediation_id,
             "reason": reason,
             "status": "completed",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": iso
         }
         
-        self.rollback_history.append(rollback_record)
+        self._store_record(rollback_record)
         
-        return {
-            "status": "completed",
-            "rollback_id": rollback_record["rollback_id"],
-            "remediation_id": remediation_id,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "previous_action": "restart_service",
-                "rollback_action": "restore_previous_state",
-                "duration_seconds": 12,
-                "resources_affected": ["i-1234567890abcdef0"],
-                "state_restored": True,
-                "health_check_passed": True
-            },
-            "message": f"Successfully rolled back remediation {remediation_id}"
-        }
+        return _build_remediation_rollback(iso, rollback_id, remediation_id, reason)
     
     async def _rollback_config(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Restore previous configuration."""
@@ -270,31 +484,14 @@ class RollbackTool:
         backup_id = args.get("backup_id")
         reason = args.get("reason")
         
-        logger.info(f"Rolling back config for {resource_uri} to {backup_id}")
+        logger.info("Rolling back config for %s to %s", resource_uri, backup_id)
         
-        # Simulate config rollback
-        await asyncio.sleep(2)
+        # Simulate config rollback. A real backend restores the backup first;
+        # the restart and the validation that follow are independent and
+        # can then be awaited together with asyncio.gather
+        await self._simulate_work(2)
         
-        return {
-            "status": "completed",
-            "action": "rollback_config",
-            "resource_uri": resource_uri,
-            "backup_id": backup_id,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "backup_timestamp": (datetime.utcnow() - timedelta(hours=2)).isoformat(),
-                "config_restored": True,
-                "changes_reverted": {
-                    "connection_pool_size": {"from": 50, "to": 20},
-                    "timeout": {"from": 60, "to": 30}
-                },
-                "restart_required": True,
-                "restart_performed": True,
-                "validation_passed": True
-            },
-            "message": f"Successfully restored configuration from backup {backup_id}"
-        }
+        return _build_config_rollback(datetime.utcnow(), resource_uri, backup_id, reason)
     
     async def _rollback_deployment(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Rollback to previous deployment version."""
@@ -302,33 +499,19 @@ class RollbackTool:
         target_version = args.get("target_version")
         reason = args.get("reason")
         
-        logger.info(f"Rolling back deployment {deployment_uri}")
+        logger.info("Rolling back deployment %s", deployment_uri)
         
-        # Simulate deployment rollback
-        await asyncio.sleep(3)
+        # Simulate deployment rollback. A real backend rolls the pods back
+        # first; health checks and the traffic switch can then be awaited
+        # together with asyncio.gather
+        await self._simulate_work(3)
         
         if not target_version:
             target_version = "v1.2.3"  # Previous version
         
-        return {
-            "status": "completed",
-            "action": "rollback_deployment",
-            "deployment_uri": deployment_uri,
-            "target_version": target_version,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "current_version": "v1.2.4",
-                "target_version": target_version,
-                "rollback_strategy": "blue_green",
-                "pods_updated": 5,
-                "rollback_duration_seconds": 45,
-                "zero_downtime": True,
-                "health_checks_passed": True,
-                "traffic_switched": True
-            },
-            "message": f"Successfully rolled back deployment to version {target_version}"
-        }
+        return _build_deployment_rollback(
+            datetime.utcnow().isoformat(), deployment_uri, target_version, reason
+        )
     
     async def _rollback_scale(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Restore previous scaling configuration."""
@@ -336,132 +519,156 @@ class RollbackTool:
         snapshot_id = args.get("snapshot_id")
         reason = args.get("reason")
         
-        logger.info(f"Rolling back scaling for {resource_uri}")
+        logger.info("Rolling back scaling for %s", resource_uri)
         
         # Simulate scale rollback
-        await asyncio.sleep(2)
+        await self._simulate_work(2)
         
         # Look up snapshot if provided
-        snapshot = self.state_snapshots.get(snapshot_id) if snapshot_id else None
+        snapshot: Optional[Mapping[str, Any]] = self.get_snapshot(snapshot_id) if snapshot_id else None
         
         if not snapshot:
             # Use default previous state
-            snapshot = {
-                "capacity": 3,
-                "instance_type": "t3.medium",
-                "auto_scaling_enabled": True
-            }
+            snapshot = _DEFAULT_SCALE_STATE
         
-        return {
-            "status": "completed",
-            "action": "rollback_scale",
-            "resource_uri": resource_uri,
-            "snapshot_id": snapshot_id,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-            "details": {
-                "current_capacity": 5,
-                "restored_capacity": snapshot.get("capacity", 3),
-                "scaling_duration_seconds": 30,
-                "instances_terminated": 2,
-                "auto_scaling_restored": snapshot.get("auto_scaling_enabled", True),
-                "health_status": "healthy"
-            },
-            "message": f"Successfully restored scaling configuration"
-        }
+        return _build_scale_rollback(
+            datetime.utcnow().isoformat(), resource_uri, snapshot_id, reason, snapshot
+        )
     
     async def _list_available_rollbacks(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """List available rollback points."""
         resource_uri = args.get("resource_uri")
-        limit = args.get("limit", 10)
+        # Arguments are not schema-validated here, so clamp for islice
+        limit = max(0, args.get("limit", 10))
         
-        logger.info(f"Listing rollback points for {resource_uri}")
+        logger.info("Listing rollback points for %s", resource_uri)
         
         # TODO: Query actual rollback history from database
         # For now, return mock data
+        now = datetime.utcnow()
         
-        rollback_points = [
-            {
-                "snapshot_id": f"snap-{datetime.utcnow().strftime('%Y%m%d')}-001",
-                "timestamp": (datetime.utcnow() - timedelta(hours=1)).isoformat(),
-                "type": "auto",
-                "description": "Pre-scaling snapshot",
-                "state": {
-                    "capacity": 3,
-                    "instance_type": "t3.medium",
-                    "auto_scaling": True
-                }
-            },
-            {
-                "snapshot_id": f"snap-{datetime.utcnow().strftime('%Y%m%d')}-002",
-                "timestamp": (datetime.utcnow() - timedelta(hours=3)).isoformat(),
-                "type": "manual",
-                "description": "Before config update",
-                "state": {
-                    "config_version": "v1.2.3",
-                    "connection_pool": 20
-                }
-            },
-            {
-                "snapshot_id": f"snap-{datetime.utcnow().strftime('%Y%m%d')}-003",
-                "timestamp": (datetime.utcnow() - timedelta(days=1)).isoformat(),
-                "type": "auto",
-                "description": "Daily backup",
-                "state": {
-                    "capacity": 2,
-                    "instance_type": "t3.small"
-                }
-            }
-        ]
+        rollback_points = list(islice(self._iter_rollback_points(now), limit))
         
         return {
             "resource_uri": resource_uri,
-            "timestamp": datetime.utcnow().isoformat(),
-            "total_rollback_points": len(rollback_points),
-            "rollback_points": rollback_points[:limit],
+            "timestamp": now.isoformat(),
+            "total_rollback_points": len(_MOCK_ROLLBACK_POINTS),
+            "rollback_points": rollback_points,
             "retention_days": self.history_retention_days
         }
     
+    def _iter_rollback_points(self, now: datetime) -> Iterator[Dict[str, Any]]:
+        """Yield rollback points newest first, building each only when consumed."""
+        day = f"{now:%Y%m%d}"
+        for number, age, point_type, description, state in _MOCK_ROLLBACK_POINTS:
+            yield {
+                "snapshot_id": f"snap-{day}-{number:03d}",
+                "timestamp": (now - age).isoformat(),
+                "type": point_type,
+                "description": description,
+                "state": dict(state)
+            }
+    
     async def _create_snapshot(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Create a state snapshot."""
         resource_uri = args.get("resource_uri")
         description = args.get("description", "Manual snapshot")
         
-        logger.info(f"Creating snapshot for {resource_uri}")
+        logger.info("Creating snapshot for %s", resource_uri)
         
-        snapshot_id = f"snap-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.utcnow()
+        iso = now.isoformat()
+        snapshot_id = self._ids.new("snap")
         
         # TODO: Capture actual resource state
         # For now, create mock snapshot
         snapshot = {
             "snapshot_id": snapshot_id,
             "resource_uri": resource_uri,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": iso,
             "description": description,
-            "state": {
-                "capacity": 3,
-                "instance_type": "t3.medium",
-                "auto_scaling_enabled": True,
-                "config_version": "v1.2.4",
-                "health_status": "healthy"
-            },
+            "state": self._diff_state(resource_uri, _MOCK_SNAPSHOT_STATE),
             "metadata": {
                 "created_by": "system",
-                "retention_until": (datetime.utcnow() + timedelta(days=self.history_retention_days)).isoformat()
+                "retention_until": (now + timedelta(days=self.history_retention_days)).isoformat()
             }
         }
         
-        # Store snapshot
+        # Store snapshot, evicting the least recently used ones past the cap
         self.state_snapshots[snapshot_id] = snapshot
+        self.state_snapshots.move_to_end(snapshot_id)
+        created = time.time()
+        self._snapshot_created[snapshot_id] = created
+        heapq.heappush(self._snapshot_heap, (created, snapshot_id))
+        while len(self.state_snapshots) > self._snapshot_cap:
+            evicted_id, _ = self.state_snapshots.popitem(last=False)
+            self._snapshot_created.pop(evicted_id, None)
+        
+        # Drop stale heap entries once they outnumber live snapshots
+        if len(self._snapshot_heap) > 2 * max(self._snapshot_cap, 1):
+            self._snapshot_heap = [(ts, sid) for sid, ts in self._snapshot_created.items()]
+            heapq.heapify(self._snapshot_heap)
+        
+        return _build_snapshot_created(iso, snapshot_id, resource_uri, description)
+    
+    async def create_snapshots_bulk(
+        self,
+        resource_uris: List[str],
+        description: str = "Bulk snapshot",
+        max_parallel: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Snapshot several resources concurrently.
         
-        return {
-            "status": "completed",
-            "snapshot_id": snapshot_id,
-            "resource_uri": resource_uri,
-            "description": description,
-            "timestamp": datetime.utcnow().isoformat(),
-            "message": f"Successfully created snapshot {snapshot_id}"
-        }
+        Args:
+            resource_uris: Resources to snapshot
+            description: Description stored on every snapshot
+            max_parallel: Maximum snapshots taken at once
+        
+        Returns:
+            Snapshot results in the same order as ``resource_uris``; failed
+            snapshots are reported with ``status: failed``
+        
+        Raises:
+            ValueError: If ``max_parallel`` is less than 1
+        """
+        return await gather_settled(
+            resource_uris,
+            lambda resource_uri: self._create_snapshot({
+                "resource_uri": resource_uri,
+                "description": description
+            }),
+            lambda resource_uri, e: {"status": "failed", "resource_uri": resource_uri, "error": str(e)},
+            max_parallel=max_parallel
+        )
+    
+    def _diff_state(self, resource_uri: Optional[str], state: Mapping[str, Any]) -> _StateDelta:
+        """
+        Encode a resource state as a delta against the resource's base state.
+        
+        The base is replaced by the new state once the delta would cover
+        more than half of its keys, which keeps deltas small and every
+        snapshot one step away from its base.
+        """
+        base = self._snapshot_bases.get(resource_uri)
+        if base is not None:
+            changed = {k: v for k, v in state.items() if k not in base or base[k] != v}
+            removed = tuple(k for k in base if k not in state)
+            if len(changed) + len(removed) <= len(state) // 2:
+                return _StateDelta(base, changed, removed)
+        
+        base = MappingProxyType(dict(state))
+        self._snapshot_bases.pop(resource_uri, None)
+        self._snapshot_bases[resource_uri] = base
+        while len(self._snapshot_bases) > self._snapshot_cap:
+            del self._snapshot_bases[next(iter(self._snapshot_bases))]
+        return _StateDelta(base, {}, ())
+    
+    def _store_record(self, record: Dict[str, Any]) -> None:
+        """Add a rollback record to the history and queue it for the audit log."""
+        self.rollback_history.append(record)
+        if self._audit_log is not None:
+            self._audit_log.write(serialize(record))
     
     def get_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -473,7 +680,8 @@ class RollbackTool:
         Returns:
             List of rollback records
         """
-        return self.rollback_history[-limit:]
+        start = max(0, len(self.rollback_history) - limit)
+        return list(islice(self.rollback_history, start, None))
     
     def get_snapshot(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -485,7 +693,15 @@ class RollbackTool:
         Returns:
             Snapshot data or None if not found
         """
-        return self.state_snapshots.get(snapshot_id)
+        snapshot = self.state_snapshots.get(snapshot_id)
+        if snapshot is None:
+            return None
+        
+        self.state_snapshots.move_to_end(snapshot_id)
+        state = snapshot.get("state")
+        if isinstance(state, _StateDelta):
+            return {**snapshot, "state": state.resolve()}
+        return snapshot
     
     def cleanup_old_snapshots(self) -> Dict[str, Any]:
         """
@@ -494,26 +710,25 @@ class RollbackTool:
         Returns:
             Cleanup summary
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=self.history_retention_days)
+        now = datetime.utcnow()
+        cutoff = time.time() - self.history_retention_days * 86400
         removed_count = 0
         
-        snapshot_ids_to_remove = []
-        for snapshot_id, snapshot in self.state_snapshots.items():
-            snapshot_time = datetime.fromisoformat(snapshot["timestamp"])
-            if snapshot_time < cutoff_date:
-                snapshot_ids_to_remove.append(snapshot_id)
-        
-        for snapshot_id in snapshot_ids_to_remove:
-            del self.state_snapshots[snapshot_id]
-            removed_count += 1
+        heap = self._snapshot_heap
+        while heap and heap[0][0] < cutoff:
+            created, snapshot_id = heapq.heappop(heap)
+            if self._snapshot_created.get(snapshot_id) == created:
+                del self._snapshot_created[snapshot_id]
+                self.state_snapshots.pop(snapshot_id, None)
+                removed_count += 1
         
-        logger.info(f"Cleaned up {removed_count} old snapshots")
+        logger.info("Cleaned up %d old snapshots", removed_count)
         
         return {
             "removed_count": removed_count,
             "remaining_count": len(self.state_snapshots),
             "retention_days": self.history_retention_days,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
     
     async def auto_rollback_on_failure(
@@ -538,7 +753,7 @@ class RollbackTool:
                 "remediation_id": remediation_id
             }
         
-        logger.warning(f"Auto-rolling back failed remediation {remediation_id}: {failure_reason}")
+        logger.warning("Auto-rolling back failed remediation %s: %s", remediation_id, failure_reason)
         
         return await self._rollback_remediation({
             "remediation_id": remediation_id,
@@ -0,0 +1,130 @@
+"""
+Batched JSON-lines audit log shared by the MCP server tools.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queued by close() to tell the worker to stop; write() only queues bytes
+_CLOSE = None
+
+
+class BatchedAuditLog:
+    """
+    Append-only JSON-lines audit log written by a background task.
+
+    Records are queued without blocking the caller and written in batches
+    once ``batch_size`` records are pending or ``flush_interval`` seconds
+    after the first record of a batch arrived, whichever comes first.
+    ``close`` writes whatever is still queued and stops the task.
+    """
+
+    __slots__ = ("path", "queue_size", "batch_size", "flush_interval", "dropped", "_queue", "_task")
+
+    def __init__(
+        self,
+        path: str,
+        queue_size: int = 10000,
+        batch_size: int = 512,
+        flush_interval: float = 1.0
+    ):
+        self.path = path
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+
+        # Created on first use, so the log can be built outside an event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def write(self, data: bytes) -> None:
+        """
+        Queue one serialized record.
+
+        Never blocks: if the queue is full the record is dropped and
+        counted in ``dropped``.
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Audit queue full, dropped record (%d dropped so far)", self.dropped)
+
+    async def flush(self) -> None:
+        """Wait until all queued records have been written."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Write all queued records, then stop the background task."""
+        task = self._task
+        self._task = None
+        if task is None or task.done() or self._queue is None:
+            return
+        # The worker writes everything queued before the sentinel and exits
+        await self._queue.put(_CLOSE)
+        await task
+
+    async def _worker(self) -> None:
+        """Drain the queue and write records in batches until closed."""
+        queue = self._queue
+        if queue is None:
+            return
+        loop = asyncio.get_running_loop()
+        batch: List[bytes] = []
+        closing = False
+        while not closing:
+            record: Optional[bytes] = await queue.get()
+            deadline = loop.time() + self.flush_interval
+            while True:
+                if record is _CLOSE:
+                    closing = True
+                    break
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+
+                try:
+                    record = queue.get_nowait()
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            if batch:
+                try:
+                    await self._write_batch(batch)
+                except Exception as e:
+                    logger.error("Failed to write %d audit records: %s", len(batch), e)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+                    batch.clear()
+            if closing:
+                queue.task_done()
+
+    async def _write_batch(self, batch: List[bytes]) -> None:
+        """Append a batch of serialized records to the log as JSON lines."""
+        lines = b"\n".join(batch) + b"\n"
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: bytes) -> None:
+        """Write pre-serialized lines to the log file."""
+        with open(self.path, "ab") as f:
+            f.write(lines)
@@ -0,0 +1,59 @@
+"""
+Concurrency helpers shared by the MCP server tools.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather_settled(
+    items: Sequence[T],
+    run: Callable[[T], Awaitable[R]],
+    on_error: Callable[[T, BaseException], R],
+    max_parallel: Optional[int] = None
+) -> List[R]:
+    """
+    Run ``run(item)`` for every item concurrently and collect the results.
+
+    An item whose call raised is reported through ``on_error`` instead of
+    failing the batch. Cancellation is not treated as a per-item error and
+    propagates to the caller.
+
+    Args:
+        items: Inputs, one call per item
+        run: Coroutine function called with each item
+        on_error: Builds the result reported for an item whose call raised
+        max_parallel: Maximum calls running at once; unlimited if omitted
+
+    Returns:
+        Results in the same order as ``items``
+
+    Raises:
+        ValueError: If ``max_parallel`` is less than 1
+    """
+    if max_parallel is not None and max_parallel < 1:
+        raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+
+    if max_parallel is None:
+        call = run
+    else:
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def call(item: T) -> R:
+            async with semaphore:
+                return await run(item)
+
+    outcomes = await asyncio.gather(*(call(item) for item in items), return_exceptions=True)
+
+    results: List[R] = []
+    for item, outcome in zip(items, outcomes, strict=True):
+        if isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+        if isinstance(outcome, BaseException):
+            results.append(on_error(item, outcome))
+        else:
+            results.append(outcome)
+    return results
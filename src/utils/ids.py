@@ -0,0 +1,35 @@
+"""
+ID generation shared by the MCP server tools.
+"""
+
+import time
+from itertools import count
+
+
+class IdGenerator:
+    """
+    Generator of unique, sortable IDs such as ``REM-20250115103000-000042``.
+
+    The UTC second is only re-formatted when it changes; the sequence
+    counter keeps IDs issued within the same second distinct.
+    """
+
+    __slots__ = ("_counter", "_last_sec", "_last_sec_str")
+
+    def __init__(self) -> None:
+        self._counter = count()
+        self._last_sec = -1
+        self._last_sec_str = ""
+
+    def new(self, prefix: str) -> str:
+        """
+        Return the next ID.
+
+        Args:
+            prefix: ID prefix, e.g. ``REM`` or ``snap``
+        """
+        sec = time.time_ns() // 1_000_000_000
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_sec_str = time.strftime('%Y%m%d%H%M%S', time.gmtime(sec))
+        return f"{prefix}-{self._last_sec_str}-{next(self._counter):06d}"
@@ -0,0 +1,55 @@
+"""
+Serialization helpers shared by the MCP server and its tools.
+"""
+
+import json
+from collections.abc import Mapping
+from types import ModuleType
+from typing import Any, Optional
+
+_orjson: Optional[ModuleType]
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    _orjson = None
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Fallback encoder for ``json.dumps(..., default=json_default)``.
+
+    Read-only mapping views (e.g. ``types.MappingProxyType``) are converted
+    to plain dicts; any other unsupported value is rendered with ``str``.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def serialize(record: Any, sort_keys: bool = False) -> bytes:
+    """
+    Encode a record as compact JSON bytes.
+
+    Uses orjson when it is installed and falls back to the standard
+    ``json`` module with the same compact separators otherwise. Pass
+    ``sort_keys=True`` for a canonical encoding suitable for hashing.
+    Values orjson rejects (e.g. integers wider than 64 bits) are retried
+    with the standard ``json`` module.
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_SORT_KEYS if sort_keys else 0
+        try:
+            data: bytes = _orjson.dumps(record, default=json_default, option=option)
+            return data
+        except _orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        record, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys, default=json_default
+    ).encode()
+
+
+def deserialize(data: bytes) -> Any:
+    """Decode JSON bytes produced by ``serialize``."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,123 @@
+"""
+Tests for the batched audit log.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.audit import BatchedAuditLog
+
+
+def read_lines(path) -> list:
+    return path.read_bytes().splitlines() if path.exists() else []
+
+
+@pytest.fixture
+def appends(monkeypatch):
+    """Record the lines passed to each file append."""
+    calls = []
+    original = BatchedAuditLog._append
+
+    def record(self, lines):
+        calls.append(lines.splitlines())
+        original(self, lines)
+
+    monkeypatch.setattr(BatchedAuditLog, "_append", record)
+    return calls
+
+
+class TestBatching:
+    """Records are written in batches by size or interval."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_written_without_waiting(self, tmp_path, appends):
+        log = BatchedAuditLog(str(tmp_path / "audit.jsonl"), batch_size=2, flush_interval=60.0)
+        for n in range(4):
+            log.write(b"%d" % n)
+
+        await asyncio.wait_for(log.flush(), timeout=1.0)
+
+        assert appends == [[b"0", b"1"], [b"2", b"3"]]
+        await log.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_is_written_after_interval(self, tmp_path, appends):
+        path = tmp_path / "audit.jsonl"
+        log = BatchedAuditLog(str(path), batch_size=100, flush_interval=0.05)
+        log.write(b"only")
+
+        await asyncio.sleep(0.01)
+        assert appends == []
+        await asyncio.wait_for(log.flush(), timeout=1.0)
+
+        assert read_lines(path) == [b"only"]
+        await log.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        log = BatchedAuditLog(str(path), queue_size=2)
+        for n in range(5):
+            log.write(b"%d" % n)
+
+        assert log.dropped == 3
+        await log.close()
+        assert read_lines(path) == [b"0", b"1"]
+
+    @pytest.mark.asyncio
+    async def test_write_error_does_not_stop_worker(self, tmp_path, monkeypatch):
+        path = tmp_path / "audit.jsonl"
+        original = BatchedAuditLog._append
+        failures = [OSError("disk full")]
+
+        def flaky(self, lines):
+            if failures:
+                raise failures.pop()
+            original(self, lines)
+
+        monkeypatch.setattr(BatchedAuditLog, "_append", flaky)
+        log = BatchedAuditLog(str(path), flush_interval=0.01)
+
+        log.write(b"lost")
+        await asyncio.wait_for(log.flush(), timeout=1.0)
+        log.write(b"kept")
+        await log.close()
+
+        assert read_lines(path) == [b"kept"]
+
+
+class TestClose:
+    """Shutdown drains the queue and stops the writer."""
+
+    @pytest.mark.asyncio
+    async def test_close_writes_queued_records(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        log = BatchedAuditLog(str(path), flush_interval=60.0)
+        for n in range(3):
+            log.write(b'{"n":%d}' % n)
+
+        await log.close()
+
+        assert read_lines(path) == [b'{"n":0}', b'{"n":1}', b'{"n":2}']
+        assert log._task is None
+
+    @pytest.mark.asyncio
+    async def test_close_without_records(self, tmp_path):
+        log = BatchedAuditLog(str(tmp_path / "audit.jsonl"))
+
+        await log.close()
+
+    @pytest.mark.asyncio
+    async def test_write_after_close_restarts_writer(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        log = BatchedAuditLog(str(path), flush_interval=0.01)
+        log.write(b"1")
+        await log.close()
+
+        log.write(b"2")
+        await log.flush()
+        await log.close()
+
+        assert read_lines(path) == [b"1", b"2"]
+        assert log._task is None
@@ -0,0 +1,69 @@
+"""
+Tests for the shared concurrency helpers.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.concurrency import gather_settled
+
+
+async def double(n: int) -> int:
+    await asyncio.sleep(0.01 * (3 - n))
+    if n < 0:
+        raise RuntimeError(f"negative: {n}")
+    return n * 2
+
+
+def report(n: int, e: BaseException) -> int:
+    return -1
+
+
+class TestGatherSettled:
+    """Concurrent calls reported in input order."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        assert await gather_settled([0, 1, 2], double, report) == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_per_item(self):
+        errors = []
+
+        def on_error(n, e):
+            errors.append((n, str(e)))
+            return None
+
+        assert await gather_settled([1, -2, 2], double, on_error) == [2, None, 4]
+        assert errors == [(-2, "negative: -2")]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates(self):
+        async def cancelled(n):
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            await gather_settled([1], cancelled, report)
+
+    @pytest.mark.asyncio
+    async def test_max_parallel_limits_running_calls(self):
+        running = 0
+        peak = 0
+
+        async def track(n):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return n
+
+        assert await gather_settled(list(range(6)), track, report, max_parallel=2) == list(range(6))
+        assert peak == 2
+
+    @pytest.mark.parametrize("max_parallel", [0, -1])
+    @pytest.mark.asyncio
+    async def test_invalid_max_parallel(self, max_parallel):
+        with pytest.raises(ValueError):
+            await gather_settled([1], double, report, max_parallel=max_parallel)
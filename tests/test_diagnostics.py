@@ -0,0 +1,112 @@
+"""
+Tests for the diagnostics tool.
+"""
+
+import pytest
+
+from src.mcp_server.config import DiagnosticsConfig
+from src.mcp_server.tools.diagnostics import DiagnosticsTool
+
+
+@pytest.fixture
+def tool() -> DiagnosticsTool:
+    return DiagnosticsTool(DiagnosticsConfig())
+
+
+class TestValidation:
+    """Arguments are checked against the tool schemas before dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_missing_required_argument(self, tool):
+        result = await tool.execute("diagnose_health", {})
+
+        assert result["tool"] == "diagnose_health"
+        assert "Invalid arguments for diagnose_health" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_argument(self, tool):
+        result = await tool.execute("diagnose_health", {"resource_uri": "x", "depth": 9})
+
+        assert "Invalid arguments" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_defaults_are_filled(self, tool, monkeypatch):
+        seen = []
+
+        async def capture(self, args):
+            seen.append(args)
+            return {}
+
+        monkeypatch.setattr(DiagnosticsTool, "_diagnose_errors", capture)
+
+        await tool.execute("diagnose_errors", {"log_source": "logs://app/errors"})
+
+        assert seen == [{"log_source": "logs://app/errors", "time_range": "1h", "severity": "error"}]
+
+    @pytest.mark.asyncio
+    async def test_caller_arguments_are_not_modified(self, tool):
+        arguments = {"resource_uri": "x"}
+        calls = [
+            {"tool": "diagnose_health", "arguments": {"resource_uri": "x"}},
+            {"tool": "diagnose_root_cause"},
+        ]
+        bundle = {"calls": calls}
+
+        await tool.execute("diagnose_health", arguments)
+        await tool.execute("diagnose_bundle", bundle)
+
+        assert arguments == {"resource_uri": "x"}
+        assert calls[0] == {"tool": "diagnose_health", "arguments": {"resource_uri": "x"}}
+        assert calls[1] == {"tool": "diagnose_root_cause"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self, tool):
+        result = await tool.execute("diagnose_bogus", {})
+
+        assert "Unknown diagnostic tool" in result["error"]
+
+
+class TestConcurrentExecution:
+    """execute_many and diagnose_bundle."""
+
+    @pytest.mark.asyncio
+    async def test_execute_many_keeps_call_order(self, tool):
+        results = await tool.execute_many([
+            ("diagnose_dependencies", {"resource_uri": "x"}),
+            ("diagnose_health", {"resource_uri": "x"}),
+        ])
+
+        assert [r["tool"] for r in results] == ["diagnose_dependencies", "diagnose_health"]
+
+    @pytest.mark.asyncio
+    async def test_execute_many_reports_failed_calls(self, tool, monkeypatch):
+        async def broken(self, args):
+            raise RuntimeError("metrics backend down")
+
+        monkeypatch.setattr(DiagnosticsTool, "_diagnose_performance", broken)
+
+        results = await tool.execute_many([
+            ("diagnose_performance", {"resource_uri": "x"}),
+            ("diagnose_health", {"resource_uri": "x"}),
+        ])
+
+        assert results[0] == {"error": "metrics backend down", "tool": "diagnose_performance"}
+        assert results[1]["tool"] == "diagnose_health"
+
+    @pytest.mark.asyncio
+    async def test_bundle(self, tool):
+        result = await tool.execute("diagnose_bundle", {"calls": [
+            {"tool": "diagnose_health", "arguments": {"resource_uri": "x"}},
+            {"tool": "diagnose_errors", "arguments": {}},
+        ]})
+
+        assert result["tool"] == "diagnose_bundle"
+        assert result["total_calls"] == 2
+        assert result["results"][0]["tool"] == "diagnose_health"
+        assert "Invalid arguments for diagnose_errors" in result["results"][1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_bundle_requires_calls(self, tool):
+        result = await tool.execute("diagnose_bundle", {"calls": []})
+
+        assert "Invalid arguments for diagnose_bundle" in result["error"]
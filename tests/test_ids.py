@@ -0,0 +1,45 @@
+"""
+Tests for the shared ID generator.
+"""
+
+from src.utils.ids import IdGenerator
+
+
+class TestUniqueness:
+    """IDs issued within the same second stay distinct."""
+
+    def test_ids_within_one_second_are_unique(self, monkeypatch):
+        monkeypatch.setattr("src.utils.ids.time.time_ns", lambda: 1_736_937_000_000_000_000)
+        ids = IdGenerator()
+
+        issued = [ids.new("REM") for _ in range(1000)]
+
+        assert len(set(issued)) == 1000
+        assert issued == sorted(issued)
+
+    def test_generators_count_independently(self):
+        first, second = IdGenerator(), IdGenerator()
+
+        assert first.new("REM").endswith("-000000")
+        assert second.new("RB").endswith("-000000")
+
+
+class TestFormat:
+    """IDs embed the UTC second, formatted once per second."""
+
+    def test_format(self, monkeypatch):
+        # 2025-01-15 10:30:00 UTC
+        monkeypatch.setattr("src.utils.ids.time.time_ns", lambda: 1_736_937_000_123_456_789)
+
+        assert IdGenerator().new("REM") == "REM-20250115103000-000000"
+
+    def test_second_is_reformatted_when_it_changes(self, monkeypatch):
+        now = [1_736_937_000_000_000_000]
+        monkeypatch.setattr("src.utils.ids.time.time_ns", lambda: now[0])
+        ids = IdGenerator()
+
+        assert ids.new("snap") == "snap-20250115103000-000000"
+        now[0] += 999_999_999
+        assert ids.new("snap") == "snap-20250115103000-000001"
+        now[0] += 1
+        assert ids.new("snap") == "snap-20250115103001-000002"
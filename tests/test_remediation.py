@@ -0,0 +1,339 @@
+"""
+Tests for the remediation tool.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from src.mcp_server.config import RemediationConfig
+from src.mcp_server.tools import remediation
+from src.mcp_server.tools.remediation import (
+    RemediationStatus,
+    RemediationTool,
+    TransientRemediationError,
+)
+
+CLEAR_CACHE_ARGS = {"cache_uri": "cache://redis/sessions", "reason": "stale sessions"}
+
+
+def make_tool(**overrides) -> RemediationTool:
+    """Build a tool that runs instantly and allows every action."""
+    settings = {"simulate_delay": False, "allowed_actions": [], "require_approval": False}
+    settings.update(overrides)
+    return RemediationTool(RemediationConfig(**settings))
+
+
+@pytest.fixture
+def slow_clear_cache(monkeypatch):
+    """Make clear_cache take a short, real amount of time when simulate_delay is on."""
+    _, builder = remediation._ACTIONS["clear_cache"]
+    monkeypatch.setitem(remediation._ACTIONS, "clear_cache", (0.05, builder))
+
+
+class TestApprovalFlow:
+    """Approve/reject workflow for remediations that require approval."""
+
+    @pytest.mark.asyncio
+    async def test_approve_runs_pending_remediation(self):
+        tool = make_tool(require_approval=True)
+
+        pending = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        assert pending["status"] == "awaiting_approval"
+
+        result = await tool.approve_remediation(pending["remediation_id"], approved_by="oncall")
+        assert result["status"] == "completed"
+        assert result["action"] == "clear_cache"
+
+        statuses = [r["status"] for r in tool.query_history(remediation_id=pending["remediation_id"])]
+        assert statuses == ["awaiting_approval", "approved", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_approve_twice_is_rejected(self):
+        tool = make_tool(require_approval=True)
+        pending = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        await tool.approve_remediation(pending["remediation_id"], approved_by="oncall")
+
+        again = await tool.approve_remediation(pending["remediation_id"], approved_by="oncall")
+        assert again["status"] == "error"
+        assert "not awaiting approval" in again["message"]
+
+    @pytest.mark.asyncio
+    async def test_reject_pending_remediation(self):
+        tool = make_tool(require_approval=True)
+        pending = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+
+        result = await tool.reject_remediation(pending["remediation_id"], "oncall", "not needed")
+        assert result["status"] == "rejected"
+        assert result["reason"] == "not needed"
+
+        approve = await tool.approve_remediation(pending["remediation_id"], approved_by="oncall")
+        assert approve["status"] == "error"
+
+        latest = tool.get_history(limit=1)[0]
+        assert latest["status"] == "rejected"
+        assert latest["rejected_by"] == "oncall"
+
+    @pytest.mark.asyncio
+    async def test_unknown_remediation(self):
+        tool = make_tool(require_approval=True)
+
+        for result in (
+            await tool.approve_remediation("REM-missing", approved_by="oncall"),
+            await tool.reject_remediation("REM-missing", "oncall", "no"),
+        ):
+            assert result["status"] == "error"
+            assert "not found" in result["message"]
+
+
+class TestExecute:
+    """Request checks performed before a remediation runs."""
+
+    @pytest.mark.asyncio
+    async def test_action_not_allowed(self):
+        tool = make_tool(allowed_actions=["restart_pod"])
+
+        result = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        assert result["status"] == "rejected"
+        assert len(tool.remediation_history) == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self):
+        tool = make_tool()
+
+        result = await tool.execute("remediate_scale_up", {"resource_uri": "x", "reason": "r"})
+        assert result["status"] == "error"
+        assert "Invalid arguments for remediate_scale_up" in result["error"]
+        assert len(tool.remediation_history) == 0
+
+    @pytest.mark.asyncio
+    async def test_extra_arguments_are_ignored(self):
+        tool = make_tool()
+
+        result = await tool.execute("remediate_clear_cache", {**CLEAR_CACHE_ARGS, "ticket": "INC-1"})
+        assert result["status"] == "completed"
+        assert result["pattern"] == "*"
+        assert "ticket" not in tool.get_history(limit=1)[0]["arguments"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self):
+        tool = make_tool()
+
+        result = await tool.execute("remediate_bogus", {})
+        assert result["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_overload_rejection(self, slow_clear_cache):
+        tool = make_tool(simulate_delay=True, max_inflight_remediations=1)
+
+        first = asyncio.create_task(tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS))
+        await asyncio.sleep(0)
+        second = await tool.execute("remediate_restart_pod", {"pod_name": "api-1", "reason": "r"})
+
+        assert second["status"] == "rejected"
+        assert second["reason"] == "overloaded"
+        assert (await first)["status"] == "completed"
+
+
+class TestIdempotency:
+    """Replaying results of duplicate requests."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_is_replayed(self):
+        tool = make_tool()
+
+        first = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        second = await tool.execute("remediate_clear_cache", dict(reversed(CLEAR_CACHE_ARGS.items())))
+
+        assert "replayed" not in first
+        assert second["replayed"] is True
+        assert second["timestamp"] == first["timestamp"]
+
+        history = tool.get_history(limit=10)
+        assert [r.get("replayed", False) for r in history] == [False, True]
+        assert history[1]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_run(self, slow_clear_cache):
+        tool = make_tool(simulate_delay=True)
+
+        results = await asyncio.gather(
+            *(tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS) for _ in range(3))
+        )
+
+        assert [r.get("replayed", False) for r in results] == [False, True, True]
+        assert len({r["timestamp"] for r in results}) == 1
+        assert not tool._idem_inflight
+
+    @pytest.mark.asyncio
+    async def test_not_replayed_when_approval_required(self):
+        tool = make_tool(require_approval=True)
+
+        first = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        second = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        assert first["remediation_id"] != second["remediation_id"]
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_result_is_evicted(self):
+        tool = make_tool(idempotency_cache_size=1)
+        other_args = {"cache_uri": "cache://redis/users", "reason": "stale users"}
+
+        await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        await tool.execute("remediate_clear_cache", other_args)
+
+        assert "replayed" not in await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        assert len(tool._idem_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        tool = make_tool()
+        await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+
+        key = tool.idempotency_key("remediate_clear_cache", {**CLEAR_CACHE_ARGS, "pattern": "*"})
+        assert tool.invalidate(key)
+        assert not tool.invalidate(key)
+        assert "replayed" not in await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_original_fails_duplicates(self, slow_clear_cache):
+        tool = make_tool(simulate_delay=True)
+
+        first = asyncio.create_task(tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        result = await second
+
+        assert not second.cancelled()
+        assert result["status"] == "failed"
+        assert result["replayed"] is True
+
+        replay = tool.get_history(limit=1)[0]
+        assert replay["status"] == "failed"
+        assert "failed_at" in replay and "completed_at" not in replay
+
+        # Nothing was cached, so the next identical request runs again
+        assert "replayed" not in await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+
+    @pytest.mark.asyncio
+    async def test_key_not_computed_when_approval_required(self, monkeypatch):
+        def fail(*args):
+            raise AssertionError("idempotency_key called")
+
+        monkeypatch.setattr(RemediationTool, "idempotency_key", staticmethod(fail))
+        tool = make_tool(require_approval=True)
+
+        result = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        assert result["status"] == "awaiting_approval"
+
+
+class TestStatusTransitions:
+    """Remediation status state machine."""
+
+    def test_labels(self):
+        assert RemediationStatus.AWAITING_APPROVAL.label == "awaiting_approval"
+
+    @pytest.mark.parametrize("current, target", [
+        (RemediationStatus.PENDING, RemediationStatus.APPROVED),
+        (RemediationStatus.AWAITING_APPROVAL, RemediationStatus.COMPLETED),
+        (RemediationStatus.COMPLETED, RemediationStatus.FAILED),
+        (RemediationStatus.REJECTED, RemediationStatus.APPROVED),
+    ])
+    def test_invalid_transition(self, current, target):
+        tool = make_tool()
+        record = {"status": current}
+
+        with pytest.raises(ValueError):
+            tool._transition(record, target)
+        assert record["status"] == current
+
+    def test_valid_transition(self):
+        tool = make_tool()
+        record = {"status": RemediationStatus.AWAITING_APPROVAL}
+
+        tool._transition(record, RemediationStatus.APPROVED)
+        assert record["status"] == RemediationStatus.APPROVED
+
+
+class TestRetry:
+    """Retrying transient handler failures."""
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self):
+        tool = make_tool(retry_base_delay=0.0, max_concurrent_remediations=1)
+        calls = []
+
+        async def flaky():
+            calls.append(tool._concurrency.locked())
+            if len(calls) < 3:
+                raise TransientRemediationError("busy")
+            return {"status": "completed"}
+
+        assert await tool._retry(flaky) == {"status": "completed"}
+        assert calls == [True, True, True]
+        assert not tool._concurrency.locked()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        tool = make_tool(retry_base_delay=0.0, max_retries=1)
+        calls = []
+
+        async def failing():
+            calls.append(None)
+            raise TransientRemediationError("busy")
+
+        with pytest.raises(TransientRemediationError):
+            await tool._retry(failing)
+        assert len(calls) == 2
+
+
+class TestConfig:
+    """Limits that would stall or disable the tool are rejected."""
+
+    @pytest.mark.parametrize("field", [
+        "max_concurrent_remediations",
+        "max_inflight_remediations",
+        "idempotency_cache_size",
+        "history_max",
+    ])
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_non_positive_limits_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            RemediationConfig(**{field: value})
+
+
+class TestAudit:
+    """Audit records written through the batched log."""
+
+    @pytest.mark.asyncio
+    async def test_close_audit_writes_pending_records(self, tmp_path):
+        path = tmp_path / "remediation.jsonl"
+        tool = make_tool(audit_log_path=str(path), audit_flush_interval=60.0)
+
+        await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        await tool.close_audit()
+
+        assert len(path.read_bytes().splitlines()) == 1
+
+    @pytest.mark.asyncio
+    async def test_audit_timestamps_are_iso_formatted(self, tmp_path):
+        path = tmp_path / "remediation.jsonl"
+        tool = make_tool(audit_log_path=str(path), require_approval=True)
+
+        pending = await tool.execute("remediate_clear_cache", CLEAR_CACHE_ARGS)
+        await tool.approve_remediation(pending["remediation_id"], approved_by="oncall")
+        await tool.close_audit()
+
+        records = [json.loads(line) for line in path.read_bytes().splitlines()]
+        assert [r["status"] for r in records] == ["awaiting_approval", "approved", "completed"]
+        completed = records[-1]
+        for field in ("timestamp", "approved_at", "completed_at"):
+            assert datetime.fromisoformat(completed[field])
+        assert completed["timestamp"] == tool.get_history(limit=1)[0]["timestamp"]
@@ -0,0 +1,173 @@
+"""
+Tests for the rollback tool.
+"""
+
+import time
+
+import pytest
+
+from src.mcp_server.config import RollbackConfig
+from src.mcp_server.tools.rollback import _MOCK_SNAPSHOT_STATE, RollbackTool, _StateDelta
+
+
+def make_tool(**overrides) -> RollbackTool:
+    """Build a tool that runs instantly."""
+    settings = {"simulate_delay": False}
+    settings.update(overrides)
+    return RollbackTool(RollbackConfig(**settings))
+
+
+async def create_snapshot(tool: RollbackTool, resource_uri: str = "infra://aws/ec2/i-1") -> str:
+    result = await tool.execute("rollback_create_snapshot", {"resource_uri": resource_uri})
+    assert result["status"] == "completed"
+    return result["snapshot_id"]
+
+
+class TestSnapshots:
+    """Snapshot storage, eviction and expiry."""
+
+    @pytest.mark.asyncio
+    async def test_delta_snapshot_resolves_full_state(self):
+        tool = make_tool()
+        first = await create_snapshot(tool)
+        second = await create_snapshot(tool)
+
+        stored = tool.state_snapshots[second]["state"]
+        assert isinstance(stored, _StateDelta)
+        assert stored.base is tool.state_snapshots[first]["state"].base
+        assert stored.changed == {}
+
+        assert tool.get_snapshot(second)["state"] == dict(_MOCK_SNAPSHOT_STATE)
+
+    def test_diff_state_rebases_on_large_change(self):
+        tool = make_tool()
+        base = tool._diff_state("res", {"a": 1, "b": 2, "c": 3, "d": 4})
+
+        small = tool._diff_state("res", {"a": 1, "b": 2, "c": 3, "d": 5})
+        assert small.base is base.base
+        assert small.changed == {"d": 5}
+        assert small.resolve() == {"a": 1, "b": 2, "c": 3, "d": 5}
+
+        large = tool._diff_state("res", {"a": 9, "b": 9, "c": 9})
+        assert large.base is not base.base
+        assert large.resolve() == {"a": 9, "b": 9, "c": 9}
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_snapshot_is_evicted(self):
+        tool = make_tool(snapshot_max=2)
+        first = await create_snapshot(tool)
+        second = await create_snapshot(tool)
+
+        assert tool.get_snapshot(first) is not None
+        third = await create_snapshot(tool)
+
+        assert list(tool.state_snapshots) == [first, third]
+        assert tool.get_snapshot(second) is None
+
+    @pytest.mark.asyncio
+    async def test_cleanup_after_eviction_skips_stale_entries(self):
+        tool = make_tool(snapshot_max=1, history_retention_days=0)
+        await create_snapshot(tool)
+        kept = await create_snapshot(tool)
+        assert list(tool.state_snapshots) == [kept]
+        assert len(tool._snapshot_heap) == 2
+
+        result = tool.cleanup_old_snapshots()
+
+        assert result["removed_count"] == 1
+        assert result["remaining_count"] == 0
+        assert not tool._snapshot_heap
+        assert not tool._snapshot_created
+
+    @pytest.mark.asyncio
+    async def test_creation_time_is_epoch_seconds(self):
+        tool = make_tool()
+        before = time.time()
+        snapshot_id = await create_snapshot(tool)
+
+        assert before <= tool._snapshot_created[snapshot_id] <= time.time()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_recent_snapshots(self):
+        tool = make_tool()
+        snapshot_id = await create_snapshot(tool)
+
+        result = tool.cleanup_old_snapshots()
+
+        assert result["removed_count"] == 0
+        assert tool.get_snapshot(snapshot_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_stale_heap_entries_are_compacted(self):
+        tool = make_tool(snapshot_max=2)
+        for _ in range(10):
+            await create_snapshot(tool)
+
+        assert len(tool.state_snapshots) == 2
+        assert len(tool._snapshot_heap) <= 4
+
+    @pytest.mark.asyncio
+    async def test_bulk_snapshots_keep_input_order(self):
+        tool = make_tool()
+        uris = [f"infra://aws/ec2/i-{n}" for n in range(5)]
+
+        results = await tool.create_snapshots_bulk(uris, max_parallel=2)
+
+        assert [r["resource_uri"] for r in results] == uris
+        assert all(r["status"] == "completed" for r in results)
+        assert len(tool.state_snapshots) == 5
+
+    @pytest.mark.asyncio
+    async def test_bulk_snapshots_reject_zero_parallelism(self):
+        tool = make_tool()
+
+        with pytest.raises(ValueError):
+            await tool.create_snapshots_bulk(["infra://aws/ec2/i-1"], max_parallel=0)
+        assert not tool.state_snapshots
+
+
+class TestRollbacks:
+    """Rollback handlers and dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_rollback_remediation_is_recorded(self):
+        tool = make_tool()
+
+        result = await tool.execute(
+            "rollback_remediation", {"remediation_id": "REM-1", "reason": "made it worse"}
+        )
+
+        assert result["status"] == "completed"
+        history = tool.get_history()
+        assert history[-1]["rollback_id"] == result["rollback_id"]
+
+    @pytest.mark.asyncio
+    async def test_rollback_scale_uses_default_state(self):
+        tool = make_tool()
+
+        result = await tool.execute("rollback_scale", {"resource_uri": "asg://web", "reason": "r"})
+
+        assert result["details"]["restored_capacity"] == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self):
+        tool = make_tool()
+
+        result = await tool.execute("rollback_bogus", {})
+        assert "Unknown rollback tool" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        tool = make_tool(enabled=False)
+
+        result = await tool.execute("rollback_config", {})
+        assert result["status"] == "error"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit, expected", [(2, 2), (0, 0), (-1, 0)])
+    async def test_list_available_limit(self, limit, expected):
+        tool = make_tool()
+
+        result = await tool.execute("rollback_list_available", {"resource_uri": "x", "limit": limit})
+
+        assert len(result["rollback_points"]) == expected
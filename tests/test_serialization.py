@@ -0,0 +1,51 @@
+"""
+Tests for the shared serialization helpers.
+"""
+
+import json
+from decimal import Decimal
+from types import MappingProxyType
+
+from src.utils import serialization
+from src.utils.serialization import deserialize, json_default, serialize
+
+
+class TestJsonDefault:
+    """Fallback encoding of values json cannot handle natively."""
+
+    def test_mapping_proxy_becomes_dict(self):
+        assert json_default(MappingProxyType({"a": 1})) == {"a": 1}
+
+    def test_other_values_use_str(self):
+        assert json_default(Decimal("1.50")) == "1.50"
+
+    def test_nested_mapping_proxies_serialize(self):
+        record = {"details": MappingProxyType({"inner": MappingProxyType({"n": 1})})}
+
+        assert json.loads(json.dumps(record, default=json_default)) == {"details": {"inner": {"n": 1}}}
+        assert deserialize(serialize(record)) == {"details": {"inner": {"n": 1}}}
+
+
+class TestSerialize:
+    """Compact JSON encoding with and without orjson."""
+
+    def test_compact_output(self):
+        assert serialize({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode()
+
+    def test_sort_keys_is_canonical(self):
+        assert serialize({"b": 1, "a": 2}, sort_keys=True) == serialize({"a": 2, "b": 1}, sort_keys=True)
+
+    def test_values_orjson_rejects_fall_back_to_json(self):
+        data = serialize({"big": 2 ** 64, "n": 1}, sort_keys=True)
+
+        assert data == b'{"big":18446744073709551616,"n":1}'
+        assert deserialize(data) == {"big": 2 ** 64, "n": 1}
+
+    def test_without_orjson(self, monkeypatch):
+        record = {"b": MappingProxyType({"x": 1}), "a": 2}
+        expected = serialize(record, sort_keys=True)
+
+        monkeypatch.setattr(serialization, "_orjson", None)
+
+        assert serialize(record, sort_keys=True) == expected
+        assert deserialize(expected) == {"a": 2, "b": {"x": 1}}